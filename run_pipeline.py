@@ -18,12 +18,12 @@ def run_shorts_pipeline():
             audio_path = temp_path / "shorts_audio.mp3"
             
             logger.info("🎙️ Seslendirme başlatılıyor...")
-            asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
+            word_timings = asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
             
-            # Videoyu oluştur
+            # Videoyu oluştur (anlatım ve kelime zamanlamaları yeniden üretilmez)
             video_path = temp_path / "shorts_video.mp4"
             logger.info("🎥 Video render ediliyor...")
-            create_shorts_video(str(audio_path), script, str(video_path))
+            create_shorts_video(str(audio_path), script, str(video_path), word_timings=word_timings)
             
             # YouTube'a yükle (private)
             logger.info("📤 YouTube'a yükleniyor...")
@@ -62,12 +62,12 @@ def run_podcast_pipeline():
             audio_path = temp_path / "podcast_audio.mp3"
             
             logger.info("🎙️ Seslendirme başlatılıyor...")
-            asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
+            word_timings = asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
             
-            # Videoyu oluştur
+            # Videoyu oluştur (anlatım ve kelime zamanlamaları yeniden üretilmez)
             video_path = temp_path / "podcast_video.mp4"
             logger.info("🎥 Video render ediliyor...")
-            create_podcast_video(str(audio_path), script, str(video_path))
+            create_podcast_video(str(audio_path), script, str(video_path), word_timings=word_timings)
             
             # YouTube'a yükle (private)
             logger.info("📤 YouTube'a yükleniyor...")
@@ -76,7 +76,8 @@ def run_podcast_pipeline():
                 f"Podcast Video",  # Başlık (elle düzenlenecek)
                 "Description will be added manually",
                 "private",
-                "podcast"
+                "podcast",
+                caption_path=str(video_path.with_suffix(".srt"))  # Video üretiminde yazılan altyazı
             )
             
             add_video_to_playlist(video_id, "PLj-SRcntMu9Ng8Snbrm2kkAppJlNHeoq9")
@@ -0,0 +1,111 @@
+# src/audio_mix.py
+"""
+Audio Mixdown
+=============
+
+Anlatım + arka plan müziği tek seferde NumPy ile miks edilir ve tek bir AAC
+dosyasına yazılır. Video birleştirme aşamasında ses stream copy ile alınır
+(MoviePy CompositeAudioClip / concatenate_audioclips yerine).
+"""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.ffmpeg_exe import get_ffmpeg_exe
+
+logger = logging.getLogger("SynapseDaily")
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+CHUNK_FRAMES = SAMPLE_RATE * 10  # Anlatım 10 sn'lik parçalarla işlenir (bellek sabit)
+AAC_BITRATE = 192_000  # Miks çıktısı (bit/sn); boyut bütçesi miksten önce bununla tahmin edilir
+
+
+def _decoder(path: str) -> subprocess.Popen:
+    """Dosyayı 44.1 kHz stereo s16le PCM olarak stdout'a decode eden ffmpeg süreci."""
+    return subprocess.Popen(
+        [get_ffmpeg_exe(), "-v", "error", "-i", str(path),
+         "-f", "s16le", "-acodec", "pcm_s16le", "-ac", str(CHANNELS), "-ar", str(SAMPLE_RATE), "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+
+def _decoder_error(proc: subprocess.Popen) -> str:
+    return proc.stderr.read().decode(errors="ignore").strip()
+
+
+def decode_audio(path: str) -> np.ndarray:
+    """Dosyanın tamamını (N, 2) int16 dizi olarak decode eder."""
+    proc = _decoder(path)
+    raw = proc.stdout.read()
+    if proc.wait() != 0:
+        raise RuntimeError(f"❌ Ses dosyası decode edilemedi ({path}): {_decoder_error(proc)}")
+    usable = len(raw) - len(raw) % (2 * CHANNELS)
+    return np.frombuffer(raw[:usable], dtype=np.int16).reshape(-1, CHANNELS)
+
+
+def mix_narration(narration_path: str, output_path: str, max_duration: float,
+                  bed_path: Optional[str] = None, bed_gain: float = 0.1) -> float:
+    """
+    Anlatımı arka plan müziğiyle miks edip AAC (.m4a) olarak yazar.
+    Müzik bir kez decode edilir ve anlatım boyunca döngüye alınır.
+    Returns:
+        float: Miksin süresi (saniye, max_duration ile sınırlı)
+    """
+    bed = None
+    if bed_path and Path(bed_path).exists():
+        try:
+            bed = decode_audio(bed_path).astype(np.float32) * bed_gain
+        except RuntimeError as e:
+            logger.warning(f"⚠️ Arka plan müziği kullanılamadı, sadece anlatım: {e}")
+        if bed is not None and not len(bed):
+            bed = None
+
+    decoder = _decoder(narration_path)
+    encoder = subprocess.Popen(
+        [get_ffmpeg_exe(), "-y", "-v", "error",
+         "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", str(CHANNELS), "-i", "-",
+         "-c:a", "aac", "-b:a", f"{AAC_BITRATE // 1000}k", str(output_path)],
+        stdin=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    max_frames = int(max_duration * SAMPLE_RATE)
+    written = 0
+    frame_bytes = 2 * CHANNELS
+    decoded_all = False
+    while written < max_frames:
+        raw = decoder.stdout.read(CHUNK_FRAMES * frame_bytes)
+        if not raw:
+            decoded_all = True
+            break
+        chunk = np.frombuffer(raw[:len(raw) - len(raw) % frame_bytes], dtype=np.int16).reshape(-1, CHANNELS)
+        chunk = chunk[:max_frames - written]
+
+        mixed = chunk.astype(np.float32)
+        if bed is not None:
+            # Müziği anlatım uzunluğuna döşe (tile)
+            mixed += bed[np.arange(written, written + len(chunk)) % len(bed)]
+        encoder.stdin.write(np.clip(mixed, -32768, 32767).astype(np.int16).tobytes())
+        written += len(chunk)
+
+    # max_duration'a ulaşıldıysa kalan anlatım okunmaz; decoder sadece sonuna kadar okunduysa denetlenir
+    if not decoded_all:
+        decoder.kill()
+    decoder_failed = decoder.wait() != 0 and decoded_all
+    decoder_stderr = _decoder_error(decoder)
+    encoder.stdin.close()
+    stderr = encoder.stderr.read()
+    if decoder_failed or written == 0:
+        encoder.wait()
+        raise RuntimeError(f"❌ Anlatım sesi decode edilemedi ({narration_path}): "
+                           f"{decoder_stderr or 'ses verisi yok'}")
+    if encoder.wait() != 0:
+        raise RuntimeError(f"❌ ffmpeg ses miks hatası: {stderr.decode(errors='ignore')}")
+
+    duration = written / SAMPLE_RATE
+    logger.info(f"🎚️ Ses miksi hazır: {duration:.1f}s ({'müzikli' if bed is not None else 'sadece anlatım'})")
+    return duration
@@ -0,0 +1,184 @@
+# src/audio_probe.py
+"""
+Audio Probe
+===========
+
+Ses dosyasının süresini ve örnek bilgilerini decode etmeden, sadece
+başlıklardan okur (MoviePy AudioFileClip / mutagen yerine):
+
+- WAV: RIFF fmt/data chunk'ları
+- MP3: Xing/Info (LAME gapless gecikme/dolgu dahil) veya VBRI etiketi;
+  etiket yoksa (ör. edge-tts CBR akışı) frame başlıkları tek geçişte sayılır
+
+Süre mikrosaniye (int) olarak döner; timeline planlama ve prompt sayısı
+hesabı ağır medya nesneleri oluşturulmadan yapılabilir.
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Optional
+
+# MPEG sürüm bitleri → (ad, örnekleme hızları)
+_MPEG_VERSIONS = {3: ("1", (44100, 48000, 32000)), 2: ("2", (22050, 24000, 16000)), 0: ("2.5", (11025, 12000, 8000))}
+_LAYERS = {3: 1, 2: 2, 1: 3}
+_BITRATES = {  # kbps, index 1..14
+    ("1", 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    ("1", 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    ("1", 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    ("2", 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    ("2", 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_BITRATES[("2", 3)] = _BITRATES[("2", 2)]
+
+
+def _parse_frame_header(data, pos: int) -> Optional[Dict]:
+    """pos'taki 4 baytlık MPEG audio frame başlığını çözer; geçersizse None."""
+    if pos + 4 > len(data):
+        return None
+    b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+    if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version_bits, layer_bits = (b1 >> 3) & 0x03, (b1 >> 1) & 0x03
+    bitrate_index, rate_index = b2 >> 4, (b2 >> 2) & 0x03
+    if version_bits not in _MPEG_VERSIONS or layer_bits not in _LAYERS or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    version, rates = _MPEG_VERSIONS[version_bits]
+    layer = _LAYERS[layer_bits]
+    bitrate = _BITRATES[("1" if version == "1" else "2", layer)][bitrate_index - 1] * 1000
+    sample_rate = rates[rate_index]
+    padding = (b2 >> 1) & 0x01
+    if layer == 1:
+        samples = 384
+        size = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if layer == 2 or version == "1" else 576
+        size = samples // 8 * bitrate // sample_rate + padding
+    return {
+        "version": version,
+        "layer": layer,
+        "bitrate": bitrate,
+        "sample_rate": sample_rate,
+        "channels": 1 if (b3 >> 6) == 3 else 2,
+        "samples": samples,
+        "size": size,
+    }
+
+
+def _id3v2_size(data) -> int:
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_mp3(data) -> Dict:
+    pos = _id3v2_size(data)
+    # İlk geçerli frame: ardından gelen frame de geçerli olmalı (yanlış sync'e karşı)
+    first = None
+    while pos + 4 <= len(data):
+        pos = data.find(b"\xff", pos)
+        if pos < 0:
+            break
+        first = _parse_frame_header(data, pos)
+        if first and (pos + first["size"] + 4 > len(data) or _parse_frame_header(data, pos + first["size"])):
+            break
+        first = None
+        pos += 1
+    if first is None:
+        raise ValueError("MP3 frame başlığı bulunamadı")
+
+    info = {"format": "mp3", "sample_rate": first["sample_rate"], "channels": first["channels"]}
+    spf = first["samples"]
+
+    # Xing/Info etiketi: side info'dan hemen sonra
+    if first["version"] == "1":
+        side_info = 17 if first["channels"] == 1 else 32
+    else:
+        side_info = 9 if first["channels"] == 1 else 17
+    xing = pos + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 0x01:
+            frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+            offset = xing + 8 + 4 + (4 if flags & 0x02 else 0) + (100 if flags & 0x04 else 0) + (4 if flags & 0x08 else 0)
+            total = frames * spf
+            # LAME gapless: encoder gecikmesi + sondaki dolgu örnekleri çalınmaz
+            lame = data[offset:offset + 24]
+            if len(lame) == 24 and lame[:4] in (b"LAME", b"Lavf", b"Lavc", b"L3.9"):
+                delay = (lame[21] << 4) | (lame[22] >> 4)
+                padding = ((lame[22] & 0x0F) << 8) | lame[23]
+                total = max(0, total - delay - padding)
+            return _finish(info, total, frames)
+
+    # VBRI etiketi (Fraunhofer): başlıktan 32 bayt sonra
+    vbri = pos + 4 + 32
+    if data[vbri:vbri + 4] == b"VBRI":
+        frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+        return _finish(info, frames * spf, frames)
+
+    # Etiket yok: frame başlıkları sayılır (yalnızca 4 bayt okunur, sonra frame boyu kadar atlanır)
+    frames = total = 0
+    while True:
+        header = _parse_frame_header(data, pos)
+        if header is None or pos + header["size"] > len(data):
+            break
+        frames += 1
+        total += header["samples"]
+        pos += header["size"]
+    return _finish(info, total, frames)
+
+
+def _probe_wav(data) -> Dict:
+    pos, fmt = 12, None
+    while pos + 8 <= len(data):
+        chunk_id, chunk_size = data[pos:pos + 4], struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            _, channels, sample_rate, _, block_align, bits = struct.unpack("<HHIIHH", data[body:body + 16])
+            fmt = {"channels": channels, "sample_rate": sample_rate, "block_align": block_align, "bits": bits}
+        elif chunk_id == b"data":
+            if fmt is None or not fmt["block_align"]:
+                raise ValueError("WAV fmt chunk'ı data'dan önce bulunamadı")
+            # Akış olarak yazılmış dosyalarda boyut alanı 0 / 0xFFFFFFFF olabilir
+            size = min(chunk_size, len(data) - body) if chunk_size not in (0, 0xFFFFFFFF) else len(data) - body
+            info = {"format": "wav", "sample_rate": fmt["sample_rate"], "channels": fmt["channels"],
+                    "bits_per_sample": fmt["bits"]}
+            return _finish(info, size // fmt["block_align"])
+        pos = body + chunk_size + (chunk_size & 1)
+    raise ValueError("WAV data chunk'ı bulunamadı")
+
+
+def _finish(info: Dict, samples: int, frames: Optional[int] = None) -> Dict:
+    info["samples"] = samples
+    info["duration_us"] = samples * 1_000_000 // info["sample_rate"]
+    if frames is not None:
+        info["frames"] = frames
+    return info
+
+
+def probe_audio(path: str) -> Dict:
+    """
+    Ses dosyasının başlık bilgileri.
+    Returns:
+        dict: {"format", "sample_rate", "channels", "samples", "duration_us", ...}
+    Raises:
+        ValueError: Desteklenmeyen veya bozuk dosya
+    """
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            raise ValueError(f"Boş ses dosyası: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+                    return _probe_wav(data)
+                return _probe_mp3(data)
+            except struct.error as e:  # Kesik başlık (fmt chunk'ı, Xing/VBRI alanları)
+                raise ValueError(f"Bozuk ses başlığı ({path}): {e}") from e
+
+
+def audio_duration(path: str) -> float:
+    """Süre (saniye)."""
+    return probe_audio(path)["duration_us"] / 1_000_000
@@ -0,0 +1,79 @@
+# src/caption_layout.py
+"""
+Caption Layout
+==============
+
+Kelime genişlikleri font başına bir kez ölçülüp saklanır; satır kaydırma
+(wrap) önbellekteki genişliklerin toplanmasıyla yapılır. Rasterizer glyph'leri
+kerning olmadan advance ile dizdiğinden toplam, çizilen satırın genişliğiyle
+aynıdır. Tüm script render öncesi tek seferde yerleştirilir.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from src.caption_raster import GlyphAtlas, get_atlas
+
+
+class CaptionLayout:
+    def __init__(self, atlas: GlyphAtlas):
+        self.atlas = atlas
+        self.space_width = atlas.text_width(" ")
+        self._word_widths: Dict[str, float] = {}
+
+    def word_width(self, word: str) -> float:
+        width = self._word_widths.get(word)
+        if width is None:
+            width = self.atlas.text_width(word)
+            self._word_widths[word] = width
+        return width
+
+    def wrap(self, words: List[str], max_width: float, inclusive: bool = True) -> List[str]:
+        """Kelimeleri max_width'e sığacak satırlara böler (genişlikler toplanarak)."""
+        lines = []
+        current, current_width = [], 0.0
+        for word in words:
+            word_w = self.word_width(word)
+            test_width = current_width + self.space_width + word_w if current else word_w
+            fits = test_width <= max_width if inclusive else test_width < max_width
+            if not current or fits:
+                current.append(word)
+                current_width = test_width
+            else:
+                lines.append(" ".join(current))
+                current, current_width = [word], word_w
+        if current:
+            lines.append(" ".join(current))
+        return lines
+
+    def line_width(self, line: str) -> float:
+        return sum(self.word_width(w) for w in line.split()) + self.space_width * line.count(" ")
+
+
+@lru_cache(maxsize=None)
+def get_layout(fontsize: int, stroke_width: int) -> CaptionLayout:
+    return CaptionLayout(get_atlas(fontsize, stroke_width))
+
+
+def layout_shorts_block(layout: CaptionLayout, words: List[str], width: int, height: int) -> List[Tuple]:
+    """Shorts: ekranın ortasında, satırları ortalanmış blok."""
+    lines = layout.wrap(words, width * 0.85, inclusive=False)
+    line_height = layout.atlas.line_height()
+    line_spacing = line_height + 4
+    line_widths = [layout.line_width(line) for line in lines]
+    block_w = max(line_widths, default=0)
+    block_h = line_spacing * (len(lines) - 1) + line_height
+    x = (width - block_w) // 2
+    y = (height - block_h) // 2 - 50
+    return [
+        (line, (x + (block_w - line_w) / 2, y + i * line_spacing))
+        for i, (line, line_w) in enumerate(zip(lines, line_widths))
+    ]
+
+
+def layout_podcast_block(layout: CaptionLayout, words: List[str], width: int, height: int,
+                         fontsize: int) -> List[Tuple]:
+    """Podcast: altta, soldan hizalı, en fazla 3 satır."""
+    lines = layout.wrap(words, width - 200)[:3]
+    y_offset = height - 350
+    return [(line, (150, y_offset + i * (fontsize + 10))) for i, line in enumerate(lines)]
@@ -0,0 +1,122 @@
+# src/caption_raster.py
+"""
+Caption Rasterizer
+==================
+
+Her font/boyut bir kez yüklenir. Karakterler kontur (stroke) dahil bir kez
+çizilip glyph atlasında maske olarak tutulur; satırlar atlastan NumPy ile
+birleştirilir ve doğrudan premultiplied sprite olarak döner.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+@lru_cache(maxsize=None)
+def get_font(fontsize: int):
+    """Fontu bir kez yükler (DejaVuSans-Bold → Arial-Bold → varsayılan)."""
+    try:
+        return ImageFont.truetype("DejaVuSans-Bold.ttf", fontsize)
+    except OSError:
+        try:
+            return ImageFont.truetype("Arial-Bold.ttf", fontsize)
+        except OSError:
+            return ImageFont.load_default()
+
+
+class GlyphAtlas:
+    """
+    Karakter başına iki maske tutar: konturlu (stroke) ve dolgu (fill).
+    Beyaz dolgu + siyah kontur, PIL'in stroke_fill davranışıyla aynıdır.
+    """
+
+    def __init__(self, font, stroke_width: int):
+        self.font = font
+        self.stroke_width = stroke_width
+        self._glyphs: Dict[str, tuple] = {}
+
+    def glyph(self, char: str) -> tuple:
+        """(stroke_mask, fill_mask, sol, üst, advance) döner."""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            sw = self.stroke_width
+            left, top, right, bottom = self.font.getbbox(char, stroke_width=sw)
+            size = (max(right - left, 1), max(bottom - top, 1))
+
+            stroke_img = Image.new("L", size, 0)
+            ImageDraw.Draw(stroke_img).text((-left, -top), char, font=self.font, fill=255,
+                                            stroke_width=sw, stroke_fill=255)
+            fill_img = Image.new("L", size, 0)
+            ImageDraw.Draw(fill_img).text((-left, -top), char, font=self.font, fill=255)
+
+            glyph = (np.asarray(stroke_img), np.asarray(fill_img), left, top, self.font.getlength(char))
+            self._glyphs[char] = glyph
+        return glyph
+
+    def text_width(self, text: str) -> float:
+        """Satırın advance genişliği (atlas üzerinden, çizim yapmadan)."""
+        return sum(self.glyph(char)[4] for char in text)
+
+    def line_height(self) -> int:
+        """PIL multiline_text ile aynı temel satır yüksekliği ("A" + kontur)."""
+        return self.font.getbbox("A", stroke_width=self.stroke_width)[3] + self.stroke_width
+
+    def place(self, text: str, origin: Tuple[float, float]) -> List[tuple]:
+        """Satırdaki her glyph'in tuval üzerindeki (x, y, stroke, fill) yerleşimini döner."""
+        x, y = origin
+        placed = []
+        for char in text:
+            stroke, fill, left, top, advance = self.glyph(char)
+            placed.append((int(round(x + left)), int(round(y + top)), stroke, fill))
+            x += advance
+        return placed
+
+
+@lru_cache(maxsize=None)
+def get_atlas(fontsize: int, stroke_width: int) -> GlyphAtlas:
+    return GlyphAtlas(get_font(fontsize), stroke_width)
+
+
+def rasterize_lines(atlas: GlyphAtlas, lines: List[Tuple[str, Tuple[float, float]]],
+                    width: int, height: int) -> Optional[Dict]:
+    """
+    Satırları (metin, sol-üst origin) atlastan birleştirip premultiplied sprite döner.
+    Sprite tuval sınırlarına kırpılır; görünür piksel yoksa None.
+    """
+    placed = [g for text, origin in lines for g in atlas.place(text, origin)]
+    placed = [g for g in placed if g[2].size]
+    if not placed:
+        return None
+
+    x0 = max(0, min(g[0] for g in placed))
+    y0 = max(0, min(g[1] for g in placed))
+    x1 = min(width, max(g[0] + g[2].shape[1] for g in placed))
+    y1 = min(height, max(g[1] + g[2].shape[0] for g in placed))
+    if x1 <= x0 or y1 <= y0:
+        return None
+
+    stroke_mask = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    fill_mask = np.zeros_like(stroke_mask)
+    for gx, gy, stroke, fill in placed:
+        # Glyph'i sprite alanına kırp
+        sx, sy = max(x0 - gx, 0), max(y0 - gy, 0)
+        ex = min(stroke.shape[1], x1 - gx)
+        ey = min(stroke.shape[0], y1 - gy)
+        if ex <= sx or ey <= sy:
+            continue
+        dst = np.s_[gy + sy - y0:gy + ey - y0, gx + sx - x0:gx + ex - x0]
+        np.maximum(stroke_mask[dst], stroke[sy:ey, sx:ex], out=stroke_mask[dst])
+        np.maximum(fill_mask[dst], fill[sy:ey, sx:ex], out=fill_mask[dst])
+
+    # Beyaz dolgu siyah konturun üstünde: A = f + s * (1 - f), premultiplied RGB = f
+    fill16 = fill_mask.astype(np.uint16)
+    alpha = fill16 + (stroke_mask.astype(np.uint16) * (255 - fill16) + 127) // 255
+    return {
+        "x": int(x0),
+        "y": int(y0),
+        "rgb": np.repeat(fill_mask[:, :, None], 3, axis=2),
+        "inv_alpha": (255 - alpha).astype(np.uint8)[:, :, None],
+    }
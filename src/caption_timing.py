@@ -0,0 +1,64 @@
+# src/caption_timing.py
+"""
+Caption Timing
+==============
+
+TTS'in WordBoundary zamanlamalarını script kelimeleriyle eşleştirir ve
+altyazı bloklarının başlangıç/bitişini tahmin yerine tablodan okur.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+LOOKAHEAD = 8  # Eşleşmeyen kelimede ileriye bakılacak boundary sayısı
+
+
+def _normalize(word: str) -> str:
+    word = unicodedata.normalize("NFKD", word).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", word.lower())
+
+
+def align_word_starts(script_words: List[str], timings: Dict) -> np.ndarray:
+    """
+    Her script kelimesinin başlangıç zamanını (saniye) döner.
+    Eşleşmeyen kelimeler (noktalama, TTS'in atladığı terimler) bir önceki
+    eşleşmenin zamanını alır.
+    """
+    spoken = [_normalize(w) for w in timings["words"]]
+    offsets = np.asarray(timings["offsets"], dtype=np.float64) / 1000.0
+    starts = np.zeros(len(script_words), dtype=np.float64)
+
+    cursor, last = 0, 0.0
+    for i, word in enumerate(script_words):
+        token = _normalize(word)
+        if token:
+            for j in range(cursor, min(cursor + LOOKAHEAD, len(spoken))):
+                # TTS bazen bileşik kelimeleri böler/birleştirir → önek eşleşmesi de kabul
+                if spoken[j] and (spoken[j] == token or token.startswith(spoken[j]) or spoken[j].startswith(token)):
+                    last = offsets[j]
+                    cursor = j + 1
+                    break
+        starts[i] = last
+    return starts
+
+
+def caption_times(captions: List[Dict], word_starts: np.ndarray, total_duration: float,
+                  timings: Optional[Dict] = None) -> List[Tuple[float, float]]:
+    """
+    Altyazı bloklarının (başlangıç, bitiş) zamanları: blok ilk kelimesinde başlar,
+    sonraki blok başlayınca biter. Son blok son kelimenin bitişine kadar sürer.
+    """
+    starts = [float(word_starts[c["word_index"]]) if c["word_index"] < len(word_starts) else total_duration
+              for c in captions]
+    end_of_speech = total_duration
+    if timings is not None and len(timings["offsets"]):
+        end_of_speech = min(total_duration, float(timings["offsets"][-1] + timings["durations"][-1]) / 1000.0)
+
+    times = []
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else max(end_of_speech, start)
+        times.append((min(start, total_duration), min(end, total_duration)))
+    return times
@@ -1,4 +1,5 @@
 # src/config.py
+import os
 from pathlib import Path
 
 class Config:
@@ -29,6 +30,57 @@ class Config:
     MAX_SHORTS_DURATION = 90   # Maksimum 90 saniye
     MAX_PODCAST_DURATION = 3600  # Maksimum 60 dakika
     
+    # Render kalite profilleri (draft: hızlı önizleme, aynı timeline mantığı)
+    # scale: kenar başına çözünürlük çarpanı (0.5 → piksel sayısının 1/4'ü)
+    # encoder: None → makine profilinden seçilir (bkz. src/encoder_profile.py)
+    # size_target: mod başına bitrate/boyut hedefi uygulanır (ENCODING_TARGETS)
+    QUALITY_PROFILES = {
+        "final": {"scale": 1.0, "fps": 24, "encoder": None, "size_target": True},
+        "draft": {"scale": 0.5, "fps": 12, "encoder": {"codec": "libx264", "preset": "ultrafast", "crf": None},
+                  "size_target": False},
+    }
+    
+    # Seslendirme backend'i: "edge" (edge-tts) veya "offline" (deterministik ton, ağ gerektirmez)
+    TTS_BACKEND = os.getenv("TTS_BACKEND", "edge")
+    # Seslendirme: cümle sınırlı parça boyu, eşzamanlı istek sayısı, parça başına deneme
+    TTS_CHUNK_CHARS = 1500
+    TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", 4))
+    TTS_RETRIES = 3
+    # TTS önbelleği (parça başına, içerik özetli)
+    TTS_CACHE = os.getenv("TTS_CACHE", "1") == "1"
+    TTS_CACHE_MB = 1024           # Disk bütçesi
+    TTS_CACHE_DIR = TEMP_DIR / "tts_cache"
+    
+    # Podcast altyazıları videoya gömülsün mü? (0 → sadece .srt/.vtt + YouTube captions)
+    PODCAST_BURN_CAPTIONS = os.getenv("PODCAST_BURN_CAPTIONS", "1") == "1"
+    
+    # Render: paralel segment worker sayısı (1 → tek süreç)
+    RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", os.cpu_count() or 1))
+    # Tek süreç modunda (RENDER_WORKERS=1) kare üreten süreç sayısı (shared memory ring)
+    RENDER_PRODUCERS = int(os.getenv("RENDER_PRODUCERS", 1))
+    
+    # Görsel önbelleği (decode + ölçeklenmiş RGB diziler)
+    IMAGE_CACHE_MB = 512          # Süreç başına bellek bütçesi
+    IMAGE_CACHE_PERSIST = os.getenv("IMAGE_CACHE_PERSIST", "1") == "1"  # .npy olarak diske yaz
+    IMAGE_CACHE_DISK_MB = 2048    # Disk bütçesi
+    IMAGE_CACHE_DIR = TEMP_DIR / "image_cache"
+    IMAGE_INDEX_DIR = TEMP_DIR / "image_index"  # Klasör başına görsel manifest'i (boyut + özet)
+    
+    # Segment önbelleği (değişmeyen segmentler yeniden kodlanmaz)
+    RENDER_CACHE = os.getenv("RENDER_CACHE", "1") == "1"
+    RENDER_CACHE_DISK_MB = 4096   # Disk bütçesi
+    RENDER_CACHE_DIR = TEMP_DIR / "render_cache"
+    
+    # Encoder kalibrasyon profili (python -m src.encoder_profile) ve tahmini yükleme hızı
+    ENCODER_PROFILE_PATH = TEMP_DIR / "encoder_profile.json"
+    UPLOAD_MBPS = float(os.getenv("UPLOAD_MBPS", 20))
+    
+    # Mod başına boyut hedefi (final kalite): video bitrate tavanı ve ses dahil dosya boyutu sınırı
+    ENCODING_TARGETS = {
+        "shorts": {"video_kbps": 5000, "max_mb": 50},
+        "podcast": {"video_kbps": 2000, "max_mb": 900},
+    }
+    
     @classmethod
     def ensure_directories(cls):
         """Gerekli dizinleri oluştur."""
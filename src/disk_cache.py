@@ -0,0 +1,49 @@
+# src/disk_cache.py
+"""
+Disk Cache Helpers
+==================
+
+Görsel, segment ve TTS önbelleklerinin ortak disk işlemleri: atomik yazım
+(pid ekli geçici dosya + os.replace) ve mtime sıralı LRU budama.
+"""
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable
+
+
+def mark_used(path: Path):
+    """Disk LRU için erişim zamanını günceller."""
+    os.utime(path)
+
+
+@contextmanager
+def atomic_path(path: Path):
+    """
+    Geçici bir yol verir; blok başarıyla biterse dosya `path`'e atomik olarak taşınır
+    (paralel worker'lar yarım yazılmış dosya görmez), hata olursa geçici dosya silinir.
+    """
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def prune_lru(directory: Path, pattern: str, max_bytes: int, keep: Iterable = ()):
+    """Dizindeki `pattern` dosyaları max_bytes'ı aşarsa en eski kullanılanları siler (keep hariç)."""
+    if not max_bytes or not directory.exists():
+        return
+    keep = {Path(p).resolve() for p in keep}
+    files = sorted(directory.glob(pattern), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in files)
+    for path in files:
+        if total <= max_bytes:
+            break
+        if keep and path.resolve() in keep:
+            continue
+        total -= path.stat().st_size
+        path.unlink(missing_ok=True)
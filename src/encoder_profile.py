@@ -0,0 +1,230 @@
+# src/encoder_profile.py
+"""
+Encoder Profile
+===============
+
+Makineye özel encoder kalibrasyonu. Kullanılabilir encoder/preset/CRF
+adayları sentetik bir timeline üzerinde bir kez denenir; her adayın hızı
+(kare/sn) ve çıktı boyutu (video saniyesi başına bayt) Config.ENCODER_PROFILE_PATH'e
+yazılır. Renderer ayarları bu profilden seçer: tahmini render + yükleme süresi
+en düşük aday. Profil yoksa eski varsayılanlara (NVENC fast / x264 ultrafast) düşülür.
+
+Kalibrasyon:  python -m src.encoder_profile
+"""
+
+import json
+import logging
+import platform
+import subprocess
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image
+
+from src.config import Config
+from src.ffmpeg_exe import get_ffmpeg_exe
+from src.renderer import CORES, DEFAULT_ENCODER, FrameComposer, Timeline, render_span
+
+logger = logging.getLogger("SynapseDaily")
+
+# Denenecek adaylar (ffmpeg'de veya makinede bulunmayan encoder'lar atlanır)
+CANDIDATES = [
+    {"codec": "libx264", "preset": preset, "crf": crf}
+    for preset in ("ultrafast", "superfast", "veryfast", "faster")
+    for crf in (23, 28)
+] + [
+    {"codec": "h264_nvenc", "preset": preset, "crf": None}
+    for preset in ("fast", "p1", "p4")
+]
+
+NVENC_DEFAULT = {"codec": "h264_nvenc", "preset": "fast", "crf": None}
+
+# Boyut hedefli kodlamada kalite tabanı ve tavanın alt sınırı
+TARGET_CRF = 23
+MIN_VIDEO_KBPS = 500
+
+
+@lru_cache(maxsize=None)
+def nvidia_gpu_available() -> bool:
+    """NVIDIA GPU var mı kontrol eder (nvidia-smi süreç başına bir kez çalıştırılır)."""
+    try:
+        result = subprocess.run(["nvidia-smi"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return result.returncode == 0
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_encoders() -> frozenset:
+    """ffmpeg'in derlendiği video encoder adları."""
+    try:
+        result = subprocess.run([get_ffmpeg_exe(), "-hide_banner", "-encoders"],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except OSError:
+        return frozenset()
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            names.add(parts[1])
+    return frozenset(names)
+
+
+def machine_id() -> Dict:
+    """Profilin geçerli olduğu makineyi tanımlar; değişirse profil yeniden ölçülmelidir."""
+    return {"host": platform.node(), "cpus": CORES, "ffmpeg": get_ffmpeg_exe(), "gpu": nvidia_gpu_available()}
+
+
+def available_candidates() -> List[Dict]:
+    encoders = ffmpeg_encoders()
+    return [
+        candidate for candidate in CANDIDATES
+        if candidate["codec"] in encoders and (candidate["codec"] != "h264_nvenc" or nvidia_gpu_available())
+    ]
+
+
+def _synthetic_timeline(work_dir: Path, width: int, height: int, fps: int, seconds: float) -> Timeline:
+    """Gerçek içeriğe benzer test timeline'ı: dokulu görsel, yarısı Ken Burns, yarısı statik, altyazılı."""
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    image = np.stack([x / width * 200, y / height * 160, (x + y) / (width + height) * 220], axis=-1)
+    image += rng.normal(0, 12, image.shape)  # Fotoğraf benzeri doku/gürültü
+    for _ in range(40):
+        x0, y0 = rng.integers(0, width), rng.integers(0, height)
+        image[y0:y0 + height // 8, x0:x0 + width // 10] = rng.integers(0, 255, 3)
+    image_path = work_dir / "calibration.png"
+    Image.fromarray(np.clip(image, 0, 255).astype(np.uint8)).save(str(image_path), compress_level=1)
+
+    timeline = Timeline(width, height, seconds, fps=fps)
+    timeline.overlay_opacity = 0.3
+    timeline.add_background(image_path, 0, seconds / 2, zoom=0.03, size=(width, height))
+    timeline.add_background(image_path, seconds / 2, seconds / 2, size=(width, height))
+    for i in range(4):
+        timeline.add_caption([(f"Calibration caption line {i + 1}", (150, height - 350))], (60, 2),
+                             i * seconds / 4, seconds / 4)
+    return timeline
+
+
+def benchmark(encoder: Dict, timeline: Timeline, work_dir: Path) -> Optional[Dict]:
+    """Timeline'ı verilen encoder ile render eder; hız ve boyutu döner (encoder çalışmazsa None)."""
+    composer = FrameComposer(timeline)
+    spans = timeline.spans()
+    paths = [work_dir / f"bench_{number}.mp4" for number in range(len(spans))]
+    started = time.perf_counter()
+    try:
+        for span, path in zip(spans, paths):
+            render_span(timeline, span, str(path), str(work_dir), encoder, CORES, composer=composer)
+    except (RuntimeError, OSError) as e:
+        logger.warning(f"⚠️ {encoder['codec']}/{encoder['preset']} çalışmadı: {str(e).strip()[:200]}")
+        return None
+    elapsed = time.perf_counter() - started
+    size = sum(path.stat().st_size for path in paths)
+    for path in paths:
+        path.unlink()
+    return {"fps": timeline.frame_count / elapsed, "bytes_per_second": size / timeline.duration}
+
+
+def calibrate(width: int = 1920, height: int = 1080, fps: int = 24, seconds: float = 8.0) -> Dict:
+    """Tüm adayları ölçer ve makine profilini Config.ENCODER_PROFILE_PATH'e yazar."""
+    candidates = available_candidates()
+    logger.info(f"⏱️ Encoder kalibrasyonu: {len(candidates)} aday, {width}x{height} @ {fps} FPS, {seconds:.0f}s")
+
+    results = []
+    Config.TEMP_DIR.mkdir(exist_ok=True, parents=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR)) as temp_dir:
+        work_dir = Path(temp_dir)
+        timeline = _synthetic_timeline(work_dir, width, height, fps, seconds)
+        for encoder in candidates:
+            measured = benchmark(encoder, timeline, work_dir)
+            if measured is None:
+                continue
+            results.append({"encoder": encoder, **measured})
+            logger.info(f"   {encoder['codec']:<11} {encoder['preset']:<10} crf={encoder['crf']!s:<4} "
+                        f"{measured['fps']:7.1f} kare/sn  {measured['bytes_per_second'] * 8 / 1e6:6.2f} Mbit/sn")
+
+    profile = {
+        "machine": machine_id(),
+        "resolution": [width, height],
+        "fps": fps,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+    Config.ENCODER_PROFILE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    Config.ENCODER_PROFILE_PATH.write_text(json.dumps(profile, indent=2))
+    load_profile.cache_clear()
+    choose_encoder.cache_clear()
+    best = choose_encoder()
+    logger.info(f"✅ Encoder profili kaydedildi: {Config.ENCODER_PROFILE_PATH} "
+                f"(seçilen: {best['codec']}/{best['preset']}, crf={best['crf']})")
+    return profile
+
+
+@lru_cache(maxsize=None)
+def load_profile() -> Optional[Dict]:
+    """Kayıtlı makine profilini okur; yoksa, bozuksa veya başka makineye aitse None döner."""
+    path = Config.ENCODER_PROFILE_PATH
+    if not path.exists():
+        return None
+    try:
+        profile = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Encoder profili okunamadı: {e}")
+        return None
+    if profile.get("machine") != machine_id():
+        logger.info("ℹ️ Encoder profili başka bir makineye ait, varsayılan ayarlar kullanılacak")
+        return None
+    return profile
+
+
+def default_encoder() -> Dict:
+    """Profil yokken: GPU varsa NVENC fast, yoksa x264 ultrafast."""
+    if nvidia_gpu_available() and "h264_nvenc" in ffmpeg_encoders():
+        return dict(NVENC_DEFAULT)
+    return dict(DEFAULT_ENCODER)
+
+
+@lru_cache(maxsize=None)
+def choose_encoder() -> Dict:
+    """
+    Profildeki en düşük maliyetli encoder: video saniyesi başına
+    render süresi + Config.UPLOAD_MBPS hızında yükleme süresi.
+    """
+    profile = load_profile()
+    if not profile or not profile["results"]:
+        return default_encoder()
+
+    upload_bytes_per_second = Config.UPLOAD_MBPS * 1e6 / 8
+
+    def cost(result: Dict) -> float:
+        return profile["fps"] / result["fps"] + result["bytes_per_second"] / upload_bytes_per_second
+
+    return dict(min(profile["results"], key=cost)["encoder"])
+
+
+def size_targeted(encoder: Dict, mode: str, duration: float, audio_bytes: int = 0) -> Dict:
+    """
+    Encoder ayarlarına mod hedefini (Config.ENCODING_TARGETS) ekler: CRF kalite
+    tabanı + maxrate tavanı (capped CRF). Çoğunlukla statik içerik tavanın çok
+    altında kalır; max_mb verilmişse tavan, ses dahil dosya bu boyutu aşmayacak
+    şekilde düşürülür.
+    """
+    target = Config.ENCODING_TARGETS[mode]
+    kbps = target["video_kbps"]
+    if target.get("max_mb") and duration > 0:
+        budget_kbps = (target["max_mb"] * 1024 * 1024 - audio_bytes) * 8 / 1000 / duration
+        kbps = min(kbps, budget_kbps)
+    # 100 kbps adımlarına yuvarlanır: süre biraz değişince segment önbelleği geçersizleşmez
+    kbps = max(MIN_VIDEO_KBPS, int(kbps // 100) * 100)
+    targeted = dict(encoder, maxrate=kbps)
+    if targeted.get("crf") is None:
+        targeted["crf"] = TARGET_CRF
+    return targeted
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    calibrate()
@@ -0,0 +1,17 @@
+# src/ffmpeg_exe.py
+"""
+FFmpeg Executable
+=================
+
+Render, ses miksi ve TTS modüllerinin ortak kullandığı ffmpeg yolu. Ayrı
+modüldedir: ses tarafı render yığınını (PIL, altyazı, önbellekler) yüklemez.
+"""
+
+
+def get_ffmpeg_exe() -> str:
+    """imageio-ffmpeg'in getirdiği ffmpeg'i, yoksa PATH'tekini döner."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
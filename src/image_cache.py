@@ -0,0 +1,115 @@
+# src/image_cache.py
+"""
+Image Cache
+===========
+
+Arka plan görsellerinin decode edilmiş ve hedef boyuta ölçeklenmiş RGB
+dizilerini süreç düzeyinde tutar. Anahtar: (yol, mtime, hedef boyut).
+Bellek bütçesi aşılınca en eski kullanılan girdi atılır (LRU).
+İsteğe bağlı olarak diziler Config.TEMP_DIR altında .npy olarak saklanır ve
+sonraki render'larda memmap ile açılır (PNG decode tamamen atlanır).
+"""
+
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from src.config import Config
+from src.disk_cache import atomic_path, mark_used, prune_lru
+
+logger = logging.getLogger("SynapseDaily")
+
+
+class ImageCache:
+    def __init__(self, max_bytes: int, persist_dir: Optional[Path] = None, max_disk_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.persist_dir = persist_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, path: str, size: Tuple[int, int]) -> tuple:
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, size[0], size[1])
+
+    def _persist_path(self, key: tuple) -> Path:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        return self.persist_dir / f"{digest}_{key[2]}x{key[3]}.npy"
+
+    def get(self, path: str, size: Tuple[int, int]) -> np.ndarray:
+        """Görseli (H, W, 3) uint8 dizi olarak, `size` = (genişlik, yükseklik) boyutunda döner."""
+        key = self._key(path, size)
+        array = self._entries.get(key)
+        if array is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return array
+
+        self.misses += 1
+        array = self._load_persisted(key)
+        if array is None:
+            with Image.open(path) as img:
+                array = np.asarray(img.convert("RGB").resize(size, Image.LANCZOS))
+            self._store_persisted(key, array)
+
+        self._insert(key, array)
+        return array
+
+    def _insert(self, key: tuple, array: np.ndarray):
+        # memmap'ler sayfa önbelleğinde durur; bütçeye sadece bellekteki diziler sayılır
+        nbytes = 0 if isinstance(array, np.memmap) else array.nbytes
+        self._entries[key] = array
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            if not isinstance(evicted, np.memmap):
+                self._bytes -= evicted.nbytes
+
+    def _load_persisted(self, key: tuple) -> Optional[np.ndarray]:
+        if not self.persist_dir:
+            return None
+        npy_path = self._persist_path(key)
+        if not npy_path.exists():
+            return None
+        try:
+            array = np.load(str(npy_path), mmap_mode="r")
+            mark_used(npy_path)
+            return array
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Görsel önbelleği okunamadı ({npy_path.name}): {e}")
+            return None
+
+    def _store_persisted(self, key: tuple, array: np.ndarray):
+        if not self.persist_dir:
+            return
+        try:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_path(self._persist_path(key)) as tmp_path, open(tmp_path, "wb") as f:
+                np.save(f, array)
+            prune_lru(self.persist_dir, "*.npy", self.max_disk_bytes)
+        except OSError as e:
+            logger.warning(f"⚠️ Görsel önbelleği yazılamadı: {e}")
+
+
+_cache: Optional[ImageCache] = None
+
+
+def get_image_cache() -> ImageCache:
+    """Süreç düzeyindeki görsel önbelleğini döner (ilk çağrıda oluşturulur)."""
+    global _cache
+    if _cache is None:
+        persist_dir = Config.IMAGE_CACHE_DIR if Config.IMAGE_CACHE_PERSIST else None
+        _cache = ImageCache(
+            max_bytes=Config.IMAGE_CACHE_MB * 1024 * 1024,
+            persist_dir=persist_dir,
+            max_disk_bytes=Config.IMAGE_CACHE_DISK_MB * 1024 * 1024,
+        )
+    return _cache
@@ -0,0 +1,103 @@
+# src/image_manifest.py
+"""
+Image Manifest
+==============
+
+Görsel klasörlerini (data/images/pod, data/images/sor) tek bir os.scandir
+geçişiyle tarar. Her uzantı ve adlandırma kabul edilir; sıralama doğal sıradır
+(2.png < 10.png, scene_2.jpg < scene_10.jpg). Boyut ve içerik özeti küçük bir
+JSON index'te tutulur; değişmeyen dosyalar (boyut + mtime) yeniden açılmaz.
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+
+from PIL import Image
+
+from src.config import Config
+from src.disk_cache import atomic_path
+from src.render_cache import file_digest
+
+logger = logging.getLogger("SynapseDaily")
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp"}
+INDEX_VERSION = 1
+
+
+def natural_key(name: str) -> list:
+    """Dosya adındaki sayıları sayı olarak karşılaştıran sıralama anahtarı."""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part.lower())
+            for part in re.split(r"(\d+)", name) if part]
+
+
+def _index_path(folder: Path) -> Path:
+    return Config.IMAGE_INDEX_DIR / f"{folder.parent.name}_{folder.name}.json"
+
+
+def _load_index(path: Path) -> Dict[str, Dict]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return {entry["name"]: entry for entry in data.get("images", [])}
+
+
+def _save_index(path: Path, folder: Path, entries: List[Dict]):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_path(path) as tmp_path:
+            tmp_path.write_text(json.dumps({"version": INDEX_VERSION, "folder": str(folder.resolve()),
+                                            "images": entries}, indent=1))
+    except OSError as e:
+        logger.warning(f"⚠️ Görsel index'i yazılamadı ({path.name}): {e}")
+
+
+def scan_images(folder: Path) -> List[Dict]:
+    """
+    Klasördeki görselleri doğal sırada döner.
+    Returns:
+        list: {"name", "path", "bytes", "mtime_ns", "width", "height", "sha1"}
+    """
+    folder = Path(folder)
+    index_path = _index_path(folder)
+    known = _load_index(index_path)
+
+    try:
+        with os.scandir(folder) as it:
+            candidates = [entry for entry in it
+                          if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
+    except FileNotFoundError:
+        logger.warning(f"⚠️ Görsel klasörü bulunamadı: {folder}")
+        return []
+
+    entries, changed = [], len(candidates) != len(known)
+    for dir_entry in sorted(candidates, key=lambda e: natural_key(e.name)):
+        stat = dir_entry.stat()
+        entry = known.get(dir_entry.name)
+        if not entry or entry["bytes"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            try:
+                with Image.open(dir_entry.path) as img:  # Sadece başlık okunur
+                    width, height = img.size
+            except OSError as e:
+                logger.warning(f"⚠️ Görsel okunamadı, atlanıyor ({dir_entry.name}): {e}")
+                continue
+            entry = {
+                "name": dir_entry.name,
+                "bytes": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "width": width,
+                "height": height,
+                "sha1": file_digest(dir_entry.path),
+            }
+            changed = True
+        entries.append(entry)
+
+    if changed:
+        _save_index(index_path, folder, entries)
+    return [dict(entry, path=str(folder / entry["name"])) for entry in entries]
@@ -0,0 +1,85 @@
+# src/ken_burns.py
+"""
+Ken Burns Kernel
+================
+
+Her görsel segmenti için tüm karelerin alt-piksel kırpma dikdörtgenleri
+önceden hesaplanır. Kareler, bir kez ölçeklenmiş tek bir kaynak tampondan
+affine warp ile üretilir (kare başına tam çözünürlüklü resize yok).
+"""
+
+import numpy as np
+from PIL import Image
+
+
+def fit_size(src_w: int, src_h: int, width: int, height: int, scale: float = 1.0) -> tuple:
+    """Tuvali tamamen kaplayan (cover) boyutu döner."""
+    if src_w / src_h > width / height:
+        w, h = src_w * height / src_h, height
+    else:
+        w, h = width, src_h * width / src_w
+    return max(width, round(w * scale)), max(height, round(h * scale))
+
+
+def source_buffer_size(src_w: int, src_h: int, width: int, height: int, zoom: float) -> tuple:
+    """Segmentin kaynak tampon boyutu: tuvali (1 + zoom) ölçeğinde kaplar."""
+    return fit_size(src_w, src_h, width, height, 1.0 + zoom)
+
+
+def plan_crops(buffer_w: int, buffer_h: int, width: int, height: int,
+               frame_count: int, zoom: float) -> np.ndarray:
+    """
+    Segmentteki her kare için kaynak tampondaki kırpma dikdörtgenini hesaplar.
+
+    Tampon, tuvali (1 + zoom) ölçeğinde kaplar; son karede kırpma 1:1 olur.
+    Returns:
+        np.ndarray: (frame_count, 4) → x0, y0, genişlik, yükseklik (float)
+    """
+    k = np.arange(frame_count, dtype=np.float64)
+    scale = 1.0 + zoom * (k / max(frame_count, 1))
+    crop_w = width * (1.0 + zoom) / scale
+    crop_h = height * (1.0 + zoom) / scale
+    x0 = (buffer_w - crop_w) / 2.0
+    y0 = (buffer_h - crop_h) / 2.0
+    return np.stack([x0, y0, crop_w, crop_h], axis=1)
+
+
+def dim_buffer(buffer: np.ndarray, opacity: float) -> np.ndarray:
+    """Siyah overlay'i (opacity) tampona tamsayı çarpımıyla bir kez uygular."""
+    if not opacity:
+        return buffer
+    level = int(round((1.0 - opacity) * 256))
+    return ((buffer.astype(np.uint16) * level) >> 8).astype(np.uint8)
+
+
+class KenBurnsSegment:
+    """Tek bir görsel segmentinin karelerini üretir."""
+
+    def __init__(self, buffer: np.ndarray, width: int, height: int, frame_count: int, zoom: float,
+                 dim: float = 0.0):
+        """
+        Args:
+            buffer: source_buffer_size() boyutunda, önceden ölçeklenmiş (H, W, 3) RGB dizi
+            dim: Kaynağa gömülecek siyah overlay opaklığı (0 → yok)
+        """
+        self.width = width
+        self.height = height
+        self.zoom = zoom
+        self.buffer = Image.fromarray(np.ascontiguousarray(dim_buffer(buffer, dim)))
+        self.plan = plan_crops(self.buffer.width, self.buffer.height, width, height, frame_count, zoom)
+        self._static = None
+
+    def frame(self, index: int) -> np.ndarray:
+        """Segment içindeki index'inci kareyi (H, W, 3) uint8 olarak döner."""
+        if not self.zoom:
+            if self._static is None:
+                x0, y0 = int(self.plan[0, 0]), int(self.plan[0, 1])
+                self._static = np.asarray(self.buffer.crop((x0, y0, x0 + self.width, y0 + self.height)))
+            return self._static
+
+        index = min(max(index, 0), len(self.plan) - 1)
+        x0, y0, crop_w, crop_h = self.plan[index]
+        # Çıktı pikseli (u, v) → kaynak (x0 + u * sx, y0 + v * sy)
+        coeffs = (crop_w / self.width, 0.0, x0, 0.0, crop_h / self.height, y0)
+        warped = self.buffer.transform((self.width, self.height), Image.AFFINE, coeffs, resample=Image.BILINEAR)
+        return np.asarray(warped)
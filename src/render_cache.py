@@ -0,0 +1,85 @@
+# src/render_cache.py
+"""
+Render Cache
+============
+
+Kodlanmış timeline segmentlerini içerik özetine (hash) göre saklar.
+Özet; görsel dosyalarının baytlarını, altyazı metni/konumunu, zamanlamayı,
+efekt parametrelerini ve encoder ayarlarını kapsar. Bir görsel değiştiğinde
+veya bir cümle düzeltildiğinde sadece etkilenen segmentler yeniden kodlanır,
+diğerleri önbellekten alınıp stream copy ile birleştirilir.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from src.config import Config
+from src.disk_cache import atomic_path, mark_used, prune_lru
+
+_file_digests = {}
+
+
+def file_digest(path: Optional[str]) -> Optional[str]:
+    """Dosya içeriğinin sha1 özeti; (yol, mtime, boyut) değişmedikçe yeniden okunmaz."""
+    if not path or not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _file_digests.get(key)
+    if digest is None:
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                sha1.update(block)
+        digest = sha1.hexdigest()
+        _file_digests[key] = digest
+    return digest
+
+
+class RenderCache:
+    def __init__(self, cache_dir: Path, max_disk_bytes: int = 0):
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp4"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Önbellekteki segmentin yolunu döner, yoksa None."""
+        path = self.path_for(key)
+        if path.exists():
+            mark_used(path)
+            self.hits += 1
+            return path
+        self.misses += 1
+        return None
+
+    def put(self, key: str, segment_path: str) -> Path:
+        """Yeni kodlanmış segmenti önbelleğe taşır ve önbellekteki yolunu döner."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        with atomic_path(path) as tmp_path:
+            shutil.move(str(segment_path), str(tmp_path))
+        return path
+
+    def prune(self, keep=()):
+        """Disk bütçesi aşılırsa en eski kullanılan segmentleri siler (keep hariç)."""
+        prune_lru(self.cache_dir, "*.mp4", self.max_disk_bytes, keep=keep)
+
+
+_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """Süreç düzeyindeki segment önbelleğini döner (Config.RENDER_CACHE kapalıysa None)."""
+    global _cache
+    if not Config.RENDER_CACHE:
+        return None
+    if _cache is None:
+        _cache = RenderCache(Config.RENDER_CACHE_DIR, max_disk_bytes=Config.RENDER_CACHE_DISK_MB * 1024 * 1024)
+    return _cache
@@ -0,0 +1,593 @@
+# src/renderer.py
+"""
+FFmpeg Pipe Renderer
+====================
+
+Önceden hesaplanmış bir zaman çizelgesindeki (timeline) katmanları kare kare
+birleştirir ve ham RGB kareleri doğrudan ffmpeg'in stdin'ine yazar.
+MoviePy CompositeVideoClip + write_videofile yolunun yerini alır.
+"""
+
+import hashlib
+import logging
+import math
+import multiprocessing
+import subprocess
+import tempfile
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from src.caption_raster import get_atlas, rasterize_lines
+from src.config import Config
+from src.ffmpeg_exe import get_ffmpeg_exe
+from src.image_cache import get_image_cache
+from src.ken_burns import KenBurnsSegment, source_buffer_size
+from src.render_cache import file_digest, get_render_cache
+from src.sprites import blend_sprite
+
+logger = logging.getLogger("SynapseDaily")
+CORES = multiprocessing.cpu_count()
+
+
+# ====================== ZAMAN ÇİZELGESİ ======================
+
+class Timeline:
+    """
+    Render edilecek katmanların önceden hesaplanmış listesi.
+
+    - backgrounds: {"path", "start", "end", "zoom", "size"} (path None → siyah)
+    - overlay_opacity: arka plan görsellerine bir kez uygulanan karartma
+    - captions: {"lines", "style", "start", "end"} (sprite render anında üretilir)
+    """
+
+    def __init__(self, width: int, height: int, duration: float, fps: int = 24):
+        self.width = width
+        self.height = height
+        self.duration = duration
+        self.fps = fps
+        self.overlay_opacity = 0.0
+        self.backgrounds: List[Dict] = []
+        self.captions: List[Dict] = []
+
+    @property
+    def frame_count(self) -> int:
+        return int(round(self.duration * self.fps))
+
+    def frame_of(self, t: float) -> int:
+        """t anında veya sonrasında gösterilen ilk karenin index'i."""
+        return min(int(math.ceil(t * self.fps - 1e-6)), self.frame_count)
+
+    def add_background(self, path: Optional[str], start: float, duration: float, zoom: float = 0.0,
+                       size: Optional[Tuple[int, int]] = None):
+        """
+        Arka plan görseli ekler. zoom: segment sonundaki ek büyütme oranı (0 → statik).
+        size: görselin (genişlik, yükseklik) değeri (görsel manifest'inden); None → render anında okunur.
+        """
+        self.backgrounds.append({
+            "path": str(path) if path else None,
+            "start": start,
+            "end": start + duration,
+            "zoom": zoom,
+            "size": size,
+        })
+
+    def add_caption(self, lines: List[tuple], style: tuple, start: float, duration: float):
+        """
+        Altyazı katmanı ekler. Sprite burada üretilmez; katman aktif olduğunda
+        glyph atlasından çizilir ve sınırlı bir LRU'da tutulur (bellek video süresinden bağımsız).
+        Args:
+            lines: [(satır, (x, y)), ...] yerleşim
+            style: (font boyutu, kontur kalınlığı)
+        """
+        self.captions.append({
+            "lines": lines,
+            "style": style,
+            "start": start,
+            "end": start + duration,
+        })
+
+    def background_at(self, t: float) -> Optional[Dict]:
+        for layer in self.backgrounds:
+            if layer["start"] <= t < layer["end"]:
+                return layer
+        return self.backgrounds[-1] if self.backgrounds else None
+
+    def iter_frame_layers(self, start: int, end: int):
+        """
+        Generator: [start, end) arasındaki her kare için (index, arka plan, aktif altyazılar).
+        Katmanlar başlangıç karesine göre sıralı gezilir; her kare için tüm
+        listeyi taramak yerine sadece o pencerede aktif olanlar tutulur.
+        """
+        backgrounds = sorted(self.backgrounds, key=lambda layer: layer["start"])
+        bg_starts = [self.frame_of(layer["start"]) for layer in backgrounds]
+        captions = sorted(self.captions, key=lambda layer: layer["start"])
+        cap_starts = [self.frame_of(layer["start"]) for layer in captions]
+
+        bg_index = max(bisect_right(bg_starts, start) - 1, 0)
+        cap_index = bisect_right(cap_starts, start)
+        # Başlangıçta aktif olan altyazılar (uzun katmanlar için geriye tarama)
+        active = [c for c in captions[:cap_index] if self.frame_of(c["end"]) > start]
+
+        for index in range(start, end):
+            while bg_index + 1 < len(backgrounds) and bg_starts[bg_index + 1] <= index:
+                bg_index += 1
+            while cap_index < len(captions) and cap_starts[cap_index] <= index:
+                active.append(captions[cap_index])
+                cap_index += 1
+            if active:
+                active = [c for c in active if self.frame_of(c["end"]) > index]
+            # Anlık görüntü: active sonraki karelerde yerinde güncellenir
+            yield index, (backgrounds[bg_index] if backgrounds else None), tuple(active)
+
+    def layers_between(self, start: int, end: int):
+        """[start, end) karelerinde görünen arka plan ve altyazı katmanları (çizim sırasıyla)."""
+        backgrounds = sorted(self.backgrounds, key=lambda layer: layer["start"])
+        bg_starts = [self.frame_of(layer["start"]) for layer in backgrounds]
+        first = max(bisect_right(bg_starts, start) - 1, 0)
+        last = max(bisect_left(bg_starts, end), first + 1)
+        captions = [c for c in sorted(self.captions, key=lambda layer: layer["start"])
+                    if self.frame_of(c["start"]) < end and self.frame_of(c["end"]) > start]
+        return backgrounds[first:last], captions
+
+    def spans(self, split_backgrounds: bool = False) -> List[Dict]:
+        """
+        Timeline'ı ardışık statik / hareketli span'lere ayırır.
+
+        Statik span'ler, görüntünün sabit kaldığı parçalardan (pieces) oluşur;
+        parça sınırları arka plan ve altyazı başlangıç/bitişleridir.
+        split_backgrounds=True ise span'ler görsel sınırlarında da bölünür
+        (paralel segment render için).
+        Returns:
+            list: {"start", "end", "static", "pieces"} (kare index'leri)
+        """
+        bg_cuts = {self.frame_of(layer["start"]) for layer in self.backgrounds}
+        cuts = {0, self.frame_count} | bg_cuts
+        for layer in self.backgrounds + self.captions:
+            cuts.add(self.frame_of(layer["start"]))
+            cuts.add(self.frame_of(layer["end"]))
+        cuts = sorted(cuts)
+
+        spans = []
+        for start, end in zip(cuts, cuts[1:]):
+            if end <= start:
+                continue
+            layer = self.background_at(start / self.fps)
+            static = not (layer and layer["path"] and layer["zoom"])
+            new_image = split_backgrounds and start in bg_cuts
+            if spans and spans[-1]["static"] == static and not new_image:
+                spans[-1]["end"] = end
+                spans[-1]["pieces"].append((start, end))
+            else:
+                spans.append({"start": start, "end": end, "static": static, "pieces": [(start, end)]})
+        return spans
+
+
+# ====================== KARE ÜRETİCİ ======================
+
+# Son kullanılan altyazı sprite'larının sayısı (aynı metin + konum tekrar çizilmez)
+SPRITE_CACHE_SIZE = 64
+
+
+class FrameComposer:
+    """
+    Timeline'ı kare kare üretir. Sadece o an aktif olan arka plan segmenti
+    bellekte tutulur; altyazı sprite'ları (metin, konum, stil) anahtarlı küçük
+    bir LRU'dadır, tekrar eden satırlar yeniden çizilmez.
+    """
+
+    def __init__(self, timeline: Timeline):
+        self.timeline = timeline
+        self._bg_layer = None
+        self._bg_segment = None
+        self._bg_start_frame = 0
+        self._black = np.zeros((timeline.height, timeline.width, 3), dtype=np.uint8)
+        self._sprites: "OrderedDict[tuple, Optional[Dict]]" = OrderedDict()
+
+    def _load_background(self, layer: Dict):
+        if layer is self._bg_layer:
+            return
+        tl = self.timeline
+        self._bg_layer = layer
+        self._bg_segment = None  # Önceki segmentin tamponu bırakılır
+        if layer is None or not layer["path"] or not Path(layer["path"]).exists():
+            return
+
+        # Segment başına tek decode; kırpma planı tüm kareler için önceden hesaplanır
+        self._bg_start_frame = tl.frame_of(layer["start"])
+        frame_count = tl.frame_of(layer["end"]) - self._bg_start_frame
+        image_size = layer.get("size")
+        if image_size is None:
+            with Image.open(layer["path"]) as img:  # Sadece başlık okunur
+                image_size = img.size
+        size = source_buffer_size(*image_size, tl.width, tl.height, layer["zoom"])
+        buffer = get_image_cache().get(layer["path"], size)
+        self._bg_segment = KenBurnsSegment(buffer, tl.width, tl.height, frame_count, layer["zoom"],
+                                           dim=tl.overlay_opacity)
+
+    def _background_frame(self, index: int, layer: Optional[Dict]) -> np.ndarray:
+        self._load_background(layer)
+        if self._bg_segment is None:
+            return self._black
+        return self._bg_segment.frame(index - self._bg_start_frame)
+
+    def _caption_sprites(self, captions: List[Dict]) -> List[Dict]:
+        """Aktif altyazıların sprite'larını LRU'dan alır, yoksa atlastan üretir."""
+        tl = self.timeline
+        sprites = []
+        for caption in captions:
+            key = (tuple(caption["lines"]), caption["style"])
+            if key in self._sprites:
+                self._sprites.move_to_end(key)
+            else:
+                self._sprites[key] = rasterize_lines(get_atlas(*caption["style"]), caption["lines"],
+                                                     tl.width, tl.height)
+                if len(self._sprites) > SPRITE_CACHE_SIZE:
+                    self._sprites.popitem(last=False)
+            if self._sprites[key]:
+                sprites.append(self._sprites[key])
+        return sprites
+
+    def compose(self, index: int, layer: Optional[Dict], captions: List[Dict]) -> np.ndarray:
+        # Yarı şeffaf siyah overlay arka plan tamponuna gömülü (bkz. KenBurnsSegment)
+        frame = self._background_frame(index, layer)
+
+        # Altyazılar: sadece sprite dikdörtgenine karıştırılır
+        sprites = self._caption_sprites(captions)
+        if sprites:
+            frame = frame.copy()
+            for sprite in sprites:
+                blend_sprite(frame, sprite)
+        return frame
+
+    def frames(self, start: int, end: int):
+        """Generator: [start, end) karelerini sırayla üretir."""
+        for index, layer, captions in self.timeline.iter_frame_layers(start, end):
+            yield self.compose(index, layer, captions)
+
+    def frame_at(self, index: int) -> np.ndarray:
+        return next(self.frames(index, index + 1))
+
+
+# ====================== FFMPEG YAZICI ======================
+
+# Hareketli segmentler aynı GOP üst sınırıyla kodlanır; SPS'ler eşleşir ve stream copy ile birleşir
+GOP_SECONDS = 25
+# Statik span'lerde (x264) keyframe aralığı: sabit görüntüde IDR tekrarına gerek yok.
+# x264'te keyint SPS'e yazılmaz; segmentler yine stream copy ile birleşir.
+STILL_GOP_SECONDS = 300
+
+
+# Encoder ayarları: {"codec", "preset", "crf", "maxrate"}
+# crf None → encoder varsayılanı; maxrate (kbps) → capped CRF tavanı (bkz. encoder_profile.size_targeted)
+DEFAULT_ENCODER = {"codec": "libx264", "preset": "ultrafast", "crf": None}
+
+
+def video_codec_args(fps: int, encoder: Optional[Dict] = None, still: bool = False,
+                     threads: int = CORES) -> List[str]:
+    """Segmentler arasında birebir aynı olması gereken video encoder parametreleri."""
+    encoder = encoder or DEFAULT_ENCODER
+    codec = encoder["codec"]
+    x264_still = still and codec == "libx264"
+    args = [
+        "-c:v", codec, "-preset", encoder["preset"], "-pix_fmt", "yuv420p",
+        "-g", str(fps * (STILL_GOP_SECONDS if x264_still else GOP_SECONDS)), "-threads", str(threads),
+    ]
+    if encoder.get("crf") is not None:
+        if codec == "h264_nvenc":
+            args += ["-rc", "vbr", "-cq", str(encoder["crf"]), "-b:v", "0"]
+        else:
+            args += ["-crf", str(encoder["crf"])]
+    if encoder.get("maxrate"):
+        args += ["-maxrate", f"{encoder['maxrate']}k", "-bufsize", f"{2 * encoder['maxrate']}k"]
+    if x264_still:
+        args += ["-tune", "stillimage"]
+    return args
+
+
+class FFmpegWriter:
+    """Ham RGB kareleri ffmpeg stdin'ine yazan alt süreç."""
+
+    def __init__(self, output_path: str, width: int, height: int, fps: int, video_args: List[str]):
+        cmd = [
+            get_ffmpeg_exe(), "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-",
+        ] + video_args + ["-movflags", "+faststart", str(output_path)]
+        self.output_path = output_path
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def write(self, frame):
+        """Kareyi (ndarray veya shared memory görünümü) kopyalamadan pipe'a yazar."""
+        if isinstance(frame, np.ndarray):
+            frame = np.ascontiguousarray(frame)
+        self.proc.stdin.write(frame)
+
+    def close(self):
+        self.proc.stdin.close()
+        stderr = self.proc.stderr.read()
+        if self.proc.wait() != 0:
+            raise RuntimeError(f"❌ ffmpeg hatası: {stderr.decode(errors='ignore')}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.proc.kill()
+            self.proc.wait()
+
+
+def run_ffmpeg(args: List[str]):
+    """ffmpeg'i verilen argümanlarla çalıştırır, hata varsa RuntimeError fırlatır."""
+    result = subprocess.run([get_ffmpeg_exe(), "-y", "-loglevel", "error"] + args,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(f"❌ ffmpeg hatası: {result.stderr.decode(errors='ignore')}")
+
+
+# ====================== SEGMENT RENDER ======================
+
+def render_animated_span(composer: FrameComposer, span: Dict, output_path: str, video_args: List[str],
+                         producers: int = 1):
+    """Hareketli span: kareler tek tek üretilip pipe edilir (producers > 1 → shared memory ring)."""
+    tl = composer.timeline
+    with FFmpegWriter(output_path, tl.width, tl.height, tl.fps, video_args) as writer:
+        if producers > 1:
+            write_frames_from_ring(tl, span["start"], span["end"], writer, producers)
+        else:
+            for frame in composer.frames(span["start"], span["end"]):
+                writer.write(frame)
+
+
+# ====================== SHARED MEMORY RING ======================
+
+RING_SLOTS_PER_PRODUCER = 2
+RING_POLL_SECONDS = 5.0
+
+
+def _ring_producer(timeline: Timeline, start: int, end: int, producer: int, producers: int,
+                   shm_name: str, free_slots: list, ready_slots: list):
+    """Worker süreç: kendi karelerini (producer, producer + N, ...) ring slotlarına yazar."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        slots = len(free_slots)
+        frame_shape = (timeline.height, timeline.width, 3)
+        frame_bytes = timeline.height * timeline.width * 3
+        composer = FrameComposer(timeline)
+        for index, layer, captions in timeline.iter_frame_layers(start, end):
+            if (index - start) % producers != producer:
+                continue
+            slot = (index - start) % slots
+            free_slots[slot].acquire()
+            target = np.ndarray(frame_shape, dtype=np.uint8, buffer=shm.buf, offset=slot * frame_bytes)
+            target[...] = composer.compose(index, layer, captions)
+            del target  # shm.close() öncesi buffer referansı kalmamalı
+            ready_slots[slot].release()
+    finally:
+        shm.close()
+
+
+def write_frames_from_ring(timeline: Timeline, start: int, end: int, writer: FFmpegWriter, producers: int):
+    """
+    N producer süreci kareleri multiprocessing.shared_memory ring'ine yazar; bu süreç
+    (writer) tamamlanan slotları sırayla, kopyalamadan ffmpeg stdin'ine aktarır.
+    """
+    ctx = multiprocessing.get_context("fork")
+    slots = producers * RING_SLOTS_PER_PRODUCER
+    frame_bytes = timeline.height * timeline.width * 3
+    shm = shared_memory.SharedMemory(create=True, size=slots * frame_bytes)
+    free_slots = [ctx.Semaphore(1) for _ in range(slots)]
+    ready_slots = [ctx.Semaphore(0) for _ in range(slots)]
+    workers = [
+        ctx.Process(target=_ring_producer,
+                    args=(timeline, start, end, p, producers, shm.name, free_slots, ready_slots), daemon=True)
+        for p in range(producers)
+    ]
+    try:
+        for worker in workers:
+            worker.start()
+        for index in range(start, end):
+            slot = (index - start) % slots
+            while not ready_slots[slot].acquire(timeout=RING_POLL_SECONDS):
+                if any(w.exitcode not in (None, 0) for w in workers):
+                    raise RuntimeError("❌ Frame producer süreci beklenmedik şekilde sonlandı")
+            # Görünüm hata olsa da bırakılır; yoksa traceback'te kalan export shm.close()'u engeller
+            with shm.buf[slot * frame_bytes:(slot + 1) * frame_bytes] as view:
+                writer.write(view)
+            free_slots[slot].release()
+        for worker in workers:
+            worker.join()
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.kill()
+        try:
+            shm.close()
+        finally:
+            shm.unlink()
+
+
+def render_static_span(composer: FrameComposer, span: Dict, output_path: str,
+                       video_args: List[str], work_dir: Path):
+    """
+    Statik span: her sabit parça için tek kare üretilir, PNG olarak yazılır ve
+    concat demuxer (süre direktifleriyle) üzerinden tek seferde kodlanır.
+    """
+    tl = composer.timeline
+    list_path = work_dir / f"stills_{span['start']:07d}.txt"
+    lines = ["ffconcat version 1.0"]
+    still_paths = []
+
+    # Ara dosyalar span kodlanır kodlanmaz silinir (uzun podcast'te binlerce PNG birikmez)
+    try:
+        for start, end in span["pieces"]:
+            still_path = work_dir / f"still_{start:07d}.png"
+            still_paths.append(still_path)
+            Image.fromarray(composer.frame_at(start)).save(str(still_path), compress_level=1)
+            lines.append(f"file '{still_path.name}'")
+            lines.append(f"duration {(end - start) / tl.fps:.6f}")
+        # concat demuxer son dosyanın süresini ancak dosya tekrarlanırsa uygular
+        lines.append(f"file '{still_paths[-1].name}'")
+        list_path.write_text("\n".join(lines) + "\n")
+
+        run_ffmpeg([
+            "-f", "concat", "-safe", "0", "-i", str(list_path),
+            "-vf", f"fps={tl.fps}", "-frames:v", str(span["end"] - span["start"]),
+        ] + video_args + [str(output_path)])
+    finally:
+        for path in still_paths + [list_path]:
+            path.unlink(missing_ok=True)
+
+
+def concat_segments(segment_paths: List[str], output_path: str, work_dir: Path,
+                    audio_path: Optional[str] = None):
+    """Segmentleri concat demuxer ile stream copy yaparak birleştirir, sesi mux eder."""
+    list_path = work_dir / "segments.txt"
+    list_path.write_text("".join(f"file '{Path(p).resolve()}'\n" for p in segment_paths))
+
+    args = ["-f", "concat", "-safe", "0", "-i", str(list_path)]
+    if audio_path:
+        # Önceden miks edilmiş AAC ses yeniden kodlanmaz
+        audio_codec = "copy" if Path(audio_path).suffix in (".m4a", ".aac") else "aac"
+        args += ["-i", str(audio_path), "-map", "0:v", "-map", "1:a", "-c:a", audio_codec, "-shortest"]
+    args += ["-c:v", "copy", "-movflags", "+faststart", str(output_path)]
+    run_ffmpeg(args)
+
+
+# Renderer'ın çıktısını değiştiren bir değişiklikte artırılır (eski önbellek girdileri geçersizleşir)
+SEGMENT_FORMAT_VERSION = 1
+
+
+def span_digest(timeline: Timeline, span: Dict, video_args: List[str]) -> str:
+    """
+    Segmentin içerik özeti: görsel baytları, altyazı metni/konumu, zamanlama
+    (span başına göre kare cinsinden), efekt parametreleri ve encoder ayarları.
+    Zamanlar göreli olduğundan timeline'da kayan ama değişmeyen segmentler de eşleşir.
+    """
+    start = span["start"]
+
+    def rel(t: float) -> int:
+        return timeline.frame_of(t) - start
+
+    backgrounds, captions = timeline.layers_between(start, span["end"])
+    # Thread sayısı çıktının geçerliliğini etkilemez; worker sayısı değişince önbellek korunur
+    args = [arg for i, arg in enumerate(video_args)
+            if arg != "-threads" and (i == 0 or video_args[i - 1] != "-threads")]
+    signature = (
+        SEGMENT_FORMAT_VERSION, timeline.width, timeline.height, timeline.fps, timeline.overlay_opacity,
+        args, span["static"], span["end"] - start, [(a - start, b - start) for a, b in span["pieces"]],
+        [(file_digest(layer["path"]), layer["zoom"], rel(layer["start"]), rel(layer["end"])) for layer in backgrounds],
+        [(layer["lines"], layer["style"], rel(layer["start"]), rel(layer["end"])) for layer in captions],
+    )
+    return hashlib.sha1(repr(signature).encode()).hexdigest()
+
+
+def render_span(timeline: Timeline, span: Dict, segment_path: str, work_dir: str,
+                encoder: Dict, threads: int, composer: Optional[FrameComposer] = None,
+                producers: int = 1) -> str:
+    """Tek bir span'i segment dosyasına render eder (process pool worker'ı olarak da çalışır)."""
+    composer = composer or FrameComposer(timeline)
+    video_args = video_codec_args(timeline.fps, encoder, still=span["static"], threads=threads)
+    if span["static"]:
+        render_static_span(composer, span, segment_path, video_args, Path(work_dir))
+    else:
+        render_animated_span(composer, span, segment_path, video_args, producers=producers)
+    return segment_path
+
+
+_worker_timeline: Optional[Timeline] = None
+
+
+def _init_worker(timeline: Timeline):
+    """Process pool worker'ına timeline'ı bir kez aktarır."""
+    global _worker_timeline
+    _worker_timeline = timeline
+
+
+def _render_span_job(span: Dict, segment_path: str, work_dir: str, encoder: Dict, threads: int) -> str:
+    return render_span(_worker_timeline, span, segment_path, work_dir, encoder, threads)
+
+
+def render_timeline(timeline: Timeline, output_path: str, audio_path: Optional[str] = None,
+                    encoder: Optional[Dict] = None, workers: int = 1, producers: int = 1):
+    """
+    Timeline'ı statik/hareketli span'lere ayırır, her span'i ayrı segment olarak
+    kodlar ve segmentleri stream copy ile birleştirir.
+
+    workers > 1 ise timeline görsel sınırlarında bölünür ve segmentler
+    ProcessPoolExecutor içinde paralel render edilir. workers == 1 ve
+    producers > 1 ise hareketli span'ler shared memory ring ile üretilir
+    (iki mod birlikte kullanılmaz: her worker ayrıca producer süreçleri açarsa
+    çekirdek sayısının workers * producers katı süreç CPU için yarışır).
+
+    Config.RENDER_CACHE açıksa özeti değişmeyen segmentler önbellekten alınır,
+    sadece kirli segmentler yeniden kodlanır.
+    """
+    # Önbellek açıkken span'ler görsel sınırlarında bölünür: bir görsel değişince sadece o segment kirlenir
+    cache = get_render_cache()
+    spans = timeline.spans(split_backgrounds=workers > 1 or cache is not None)
+    static_frames = sum(span["end"] - span["start"] for span in spans if span["static"])
+    logger.info(f"🎞️ Pipe render: {timeline.frame_count} kare ({timeline.width}x{timeline.height} @ {timeline.fps} FPS), "
+                f"{len(spans)} span, statik: %{100 * static_frames // max(timeline.frame_count, 1)}")
+
+    # Tüm segmentlerde aynı encoder ayarları
+    encoder = encoder or DEFAULT_ENCODER
+
+    Config.TEMP_DIR.mkdir(exist_ok=True, parents=True)
+    with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR)) as temp_dir:
+        work_dir = Path(temp_dir)
+        segment_paths = []
+        pending = []  # (sıra, span, segment yolu, özet): yeniden kodlanacak segmentler
+        for number, span in enumerate(spans):
+            key = None
+            if cache is not None:
+                key = span_digest(timeline, span, video_codec_args(timeline.fps, encoder, still=span["static"]))
+                cached = cache.get(key)
+                if cached is not None:
+                    segment_paths.append(str(cached))
+                    continue
+            path = str(work_dir / f"segment_{number:04d}.mp4")
+            segment_paths.append(path)
+            pending.append((number, span, path, key))
+        if cache is not None:
+            logger.info(f"♻️ Segment önbelleği: {len(spans) - len(pending)}/{len(spans)} segment yeniden kullanıldı")
+
+        # Thread sayısı gerçekte eşzamanlı çalışan encoder sayısına göre (tek kirli segment → tüm çekirdekler)
+        concurrency = min(workers, len(pending)) if workers > 1 and len(pending) > 1 else 1
+        threads = max(1, CORES // concurrency)
+        if pending:
+            logger.info(f"🧵 {len(pending)} segment kodlanıyor: worker: {concurrency}, encoder thread: {threads}")
+
+        if concurrency > 1:
+            with ProcessPoolExecutor(max_workers=concurrency, initializer=_init_worker,
+                                     initargs=(timeline,)) as executor:
+                futures = [
+                    executor.submit(_render_span_job, span, path, temp_dir, encoder, threads)
+                    for _, span, path, _ in pending
+                ]
+                for future in futures:
+                    future.result()
+        elif pending:
+            composer = FrameComposer(timeline)
+            for _, span, path, _ in pending:
+                render_span(timeline, span, path, temp_dir, encoder, threads, composer=composer,
+                            producers=producers)
+
+        if cache is not None:
+            for number, _, path, key in pending:
+                segment_paths[number] = str(cache.put(key, path))
+
+        concat_segments(segment_paths, output_path, work_dir, audio_path=audio_path)
+
+    if cache is not None:
+        cache.prune(keep=segment_paths)
@@ -453,10 +453,9 @@ class QwenScriptGenerator:
             # Run TTS
             asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
             
-            # Calculate duration
-            import mutagen
-            audio = mutagen.File(str(audio_path))
-            duration_seconds = int(audio.info.length) if audio else 0
+            # Calculate duration (header-only probe, no decoding)
+            from src.audio_probe import audio_duration
+            duration_seconds = int(audio_duration(str(audio_path)))
             
             logger.info(f"✅ Audio generated: {audio_path} ({duration_seconds}s)")
             
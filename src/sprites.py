@@ -0,0 +1,23 @@
+# src/sprites.py
+"""
+Caption Sprites
+===============
+
+Altyazı satırları tam tuval RGBA yerine sıkı sınır kutusuna (bounding box)
+kırpılmış, alfa ile önceden çarpılmış (premultiplied) sprite'lar olarak
+tutulur ve karede sadece kendi dikdörtgenine karıştırılır.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+
+def blend_sprite(frame: np.ndarray, sprite: Dict):
+    """Sprite'ı karede yerinde (in-place) sadece kendi dikdörtgenine karıştırır."""
+    h, w = sprite["rgb"].shape[:2]
+    x, y = sprite["x"], sprite["y"]
+    region = frame[y:y + h, x:x + w]
+    blended = (region.astype(np.uint16) * sprite["inv_alpha"] + 127) // 255 + sprite["rgb"]
+    region[...] = np.minimum(blended, 255).astype(np.uint8)
+
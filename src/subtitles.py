@@ -0,0 +1,34 @@
+# src/subtitles.py
+"""
+Subtitle Export
+===============
+
+Altyazı bloklarını zamanlı .srt / .vtt dosyalarına yazar (YouTube altyazı
+yüklemesi ve altyazısız render modu için).
+"""
+
+from pathlib import Path
+from typing import List, Tuple
+
+
+def _timestamp(seconds: float, separator: str) -> str:
+    ms = int(round(max(seconds, 0.0) * 1000))
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    secs, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{ms:03d}"
+
+
+def write_srt(entries: List[Tuple[float, float, str]], path: str):
+    """entries: [(başlangıç, bitiş, metin), ...]"""
+    blocks = [
+        f"{number}\n{_timestamp(start, ',')} --> {_timestamp(end, ',')}\n{text}\n"
+        for number, (start, end, text) in enumerate(entries, 1)
+    ]
+    Path(path).write_text("\n".join(blocks), encoding="utf-8")
+
+
+def write_vtt(entries: List[Tuple[float, float, str]], path: str):
+    """entries: [(başlangıç, bitiş, metin), ...]"""
+    blocks = [f"{_timestamp(start, '.')} --> {_timestamp(end, '.')}\n{text}\n" for start, end, text in entries]
+    Path(path).write_text("WEBVTT\n\n" + "\n".join(blocks), encoding="utf-8")
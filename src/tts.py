@@ -1,10 +1,113 @@
 # src/tts.py
 import asyncio
-import edge_tts
-from src.utils import get_current_index
+import logging
+import re
+import zlib
+from pathlib import Path
+import numpy as np
+from src.config import Config
+from src.tts_backends import OUTPUT_BITRATE, TTSBackend, get_tts_backend
+from src.tts_cache import get_tts_cache
 
-async def generate_voice_with_edge_tts(text: str, output_path: str):
-    """AI zaten CTA eklememişse CTA ekle, eklemişse dokunma."""
+logger = logging.getLogger("SynapseDaily")
+
+# İçerik tanımlı parça sınırı: minimum boydan sonra cümle özeti bu değere bölünürse parça kapanır
+CHUNK_BOUNDARY_MODULUS = 4
+
+def word_timings_path(audio_path: str) -> Path:
+    """Ses dosyasının yanındaki kelime zamanlama dosyası (audio.mp3 → audio.words.npz)."""
+    return Path(audio_path).with_suffix(".words.npz")
+
+def save_word_timings(audio_path: str, timings: dict):
+    """Kelime zamanlamalarını kompakt .npz olarak ses dosyasının yanına yazar."""
+    np.savez(
+        str(word_timings_path(audio_path)),
+        words=np.array(timings["words"], dtype=str),
+        offsets=timings["offsets"],
+        durations=timings["durations"],
+    )
+
+def load_word_timings(audio_path: str):
+    """Kaydedilmiş kelime zamanlamalarını okur, yoksa None döner."""
+    path = word_timings_path(audio_path)
+    if not path.exists():
+        return None
+    with np.load(str(path), allow_pickle=False) as data:
+        return {
+            "words": data["words"].tolist(),
+            "offsets": data["offsets"],
+            "durations": data["durations"],
+        }
+
+def split_sentences(text: str, max_chars: int):
+    """
+    Metni cümle (ve satır) sınırlarında, her biri en fazla max_chars olan
+    parçalara böler. Tek başına sınırı aşan cümle kelime sınırından bölünür.
+    Parça sınırları cümle içeriğine bağlıdır (önceki parçaların boyuna değil):
+    bir cümle düzeltilince sadece kendi parçası değişir, diğerleri önbellekten gelir.
+    """
+    sentences = []
+    for sentence in re.split(r"(?<=[.!?])\s+|\s*\n\s*", text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            sentences.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if sentence.strip():
+            sentences.append(sentence)
+    
+    chunks, current = [], ""
+    for sentence in sentences:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+        if len(current) >= max_chars // 3 and zlib.crc32(sentence.encode("utf-8")) % CHUNK_BOUNDARY_MODULUS == 0:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def _synthesize_chunk(backend: TTSBackend, text: str, voice: str, semaphore: asyncio.Semaphore):
+    """
+    Tek parçayı seslendirir; hata olursa sadece bu parça yeniden denenir.
+    Önbellekte olan parça servise gönderilmez.
+    Returns:
+        tuple: (mp3 baytları, kelimeler, offset'ler ms, süreler ms)
+    """
+    cache = get_tts_cache()
+    key = backend.cache_key(text, voice)
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    
+    async with semaphore:
+        for attempt in range(1, Config.TTS_RETRIES + 1):
+            try:
+                audio, words, offsets, durations = await backend.synthesize(text, voice)
+                if cache is not None and key is not None:
+                    cache.put(key, audio, words, offsets, durations)
+                return audio, words, offsets, durations
+            except Exception as e:
+                if attempt == Config.TTS_RETRIES:
+                    raise
+                logger.warning(f"⚠️ TTS parçası başarısız ({attempt}/{Config.TTS_RETRIES}), yeniden deneniyor: {e}")
+                await asyncio.sleep(attempt)
+
+async def generate_voice(text: str, output_path: str, backend: TTSBackend = None):
+    """
+    AI zaten CTA eklememişse CTA ekle, eklemişse dokunma.
+    Metin cümle sınırlarında parçalanır, parçalar sınırlı eşzamanlılıkla
+    seslendirilir ve sırayla boşluksuz birleştirilir. Kelime zamanlamaları
+    önceki parçaların toplam süresi kadar kaydırılır.
+    Args:
+        backend: TTS backend'i (None → Config.TTS_BACKEND)
+    Returns:
+        dict: {"words", "offsets" (ms, int32), "durations" (ms, int32)}
+    """
     
     # AI'nın eklediği teknik terimleri temizle
     clean_text = text.replace("Opening shot", "").replace("Title:", "").replace("Chapter:", "")
@@ -13,15 +116,42 @@ async def generate_voice_with_edge_tts(text: str, output_path: str):
        
     
    
-    current_index = get_current_index()
-    voice = "en-US-GuyNeural" if current_index % 2 == 1 else "en-GB-SoniaNeural"
+    backend = backend or get_tts_backend()
+    voice = backend.select_voice()
     
-    communicate = edge_tts.Communicate(
-        clean_text, 
-        voice,
-        rate="+0%",      
-        volume="+0%",    
-        pitch="+0Hz"     
-    )
+    chunks = split_sentences(clean_text, Config.TTS_CHUNK_CHARS)
+    cache = get_tts_cache()
+    hits_before = cache.hits if cache is not None else 0
+    semaphore = asyncio.Semaphore(Config.TTS_CONCURRENCY)
+    results = await asyncio.gather(*(_synthesize_chunk(backend, chunk, voice, semaphore) for chunk in chunks))
     
-    await communicate.save(output_path)
+    words, offsets, durations = [], [], []
+    written = 0
+    with open(output_path, "wb") as audio_file:
+        for audio, chunk_words, chunk_offsets, chunk_durations in results:
+            # Parçanın başlangıcı: önceki parçaların toplam süresi (toplam bayttan, yuvarlama birikmez)
+            elapsed_ms = written * 8 * 1000 // OUTPUT_BITRATE
+            audio_file.write(audio)
+            written += len(audio)
+            words += chunk_words
+            offsets += [offset + elapsed_ms for offset in chunk_offsets]
+            durations += chunk_durations
+    elapsed_ms = written * 8 * 1000 // OUTPUT_BITRATE
+    if cache is not None:
+        cache.prune()
+        logger.info(f"🗣️ Seslendirme: {len(chunks)} parça ({cache.hits - hits_before} önbellekten), "
+                    f"{elapsed_ms / 1000:.1f}s")
+    else:
+        logger.info(f"🗣️ Seslendirme: {len(chunks)} parça, {elapsed_ms / 1000:.1f}s")
+    
+    timings = {
+        "words": words,
+        "offsets": np.array(offsets, dtype=np.int32),
+        "durations": np.array(durations, dtype=np.int32),
+    }
+    save_word_timings(output_path, timings)
+    return timings
+
+async def generate_voice_with_edge_tts(text: str, output_path: str):
+    """Geriye uyumluluk: Config.TTS_BACKEND ile seçilen backend'le seslendirir (varsayılan edge-tts)."""
+    return await generate_voice(text, output_path)
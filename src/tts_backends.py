@@ -0,0 +1,172 @@
+# src/tts_backends.py
+"""
+TTS Backends
+============
+
+Seslendirme servisinden bağımsız arayüz: metin → ses baytları + kelime
+zamanlamaları. Ses seçimi de backend'e aittir.
+
+- EdgeTTSBackend: Microsoft edge-tts (üretim)
+- OfflineTTSBackend: ağ gerektirmeyen, deterministik ton/sessizlik üreten
+  yedek (benchmark ve air-gapped CI için; süreler gerçekçi konuşma hızında)
+
+Tüm backend'ler aynı biçimi üretir: 24 kHz mono CBR 48 kbps MP3. Böylece
+parçalar bayt düzeyinde art arda eklenir ve süre = bayt * 8 / 48000 olur.
+Backend Config.TTS_BACKEND ("edge" / "offline") ile seçilir.
+"""
+
+import asyncio
+import re
+import subprocess
+from typing import List, Optional, Protocol, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.ffmpeg_exe import get_ffmpeg_exe
+from src.tts_cache import chunk_key
+from src.utils import get_current_index
+
+# Ortak çıktı biçimi
+OUTPUT_SAMPLE_RATE = 24_000
+OUTPUT_BITRATE = 48_000
+# Xing etiketi olmayan MP3'te decoder'ın çaldığı encoder + decoder gecikmesi (1105 örnek)
+MP3_DELAY_MS = 1105 * 1000 // OUTPUT_SAMPLE_RATE
+
+# (mp3 baytları, kelimeler, offset'ler ms, süreler ms)
+SynthesisResult = Tuple[bytes, List[str], List[int], List[int]]
+
+
+class TTSBackend(Protocol):
+    name: str
+
+    def select_voice(self) -> str:
+        """Bu çalıştırmada kullanılacak ses."""
+
+    def cache_key(self, text: str, voice: str) -> Optional[str]:
+        """Parçanın önbellek anahtarı; None → önbelleğe alınmaz."""
+
+    async def synthesize(self, text: str, voice: str) -> SynthesisResult:
+        """Metni seslendirir (hata durumunda exception fırlatır; yeniden deneme çağırana aittir)."""
+
+
+class EdgeTTSBackend:
+    name = "edge"
+
+    def __init__(self, rate: str = "+0%", volume: str = "+0%", pitch: str = "+0Hz"):
+        # Prozodi ayarları önbellek anahtarının parçası
+        self.rate = rate
+        self.volume = volume
+        self.pitch = pitch
+
+    def select_voice(self) -> str:
+        current_index = get_current_index()
+        return "en-US-GuyNeural" if current_index % 2 == 1 else "en-GB-SoniaNeural"
+
+    def cache_key(self, text: str, voice: str) -> Optional[str]:
+        return chunk_key(text, voice, self.rate, self.volume, self.pitch)
+
+    async def synthesize(self, text: str, voice: str) -> SynthesisResult:
+        import edge_tts  # Offline backend edge-tts kurulu olmadan da çalışır
+
+        communicate = edge_tts.Communicate(
+            text,
+            voice,
+            rate=self.rate,
+            volume=self.volume,
+            pitch=self.pitch,
+            boundary="WordBoundary"
+        )
+        audio, words, offsets, durations = bytearray(), [], [], []
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                audio += chunk["data"]
+            elif chunk["type"] == "WordBoundary":
+                # offset/duration: 100 ns birim → ms
+                words.append(chunk["text"])
+                offsets.append(chunk["offset"] // 10_000)
+                durations.append(chunk["duration"] // 10_000)
+        return bytes(audio), words, offsets, durations
+
+
+class OfflineTTSBackend:
+    """
+    Kelime başına sabit formülle süre hesaplar (≈165 kelime/dk), kelimeleri
+    kısa bir ton, araları sessizlik olarak üretir. Aynı metin her zaman aynı
+    baytları verir.
+    """
+    name = "offline"
+
+    # Ses adı → ton frekansı (Hz)
+    VOICES = {"offline-low": 140.0, "offline-high": 220.0}
+    WORD_BASE_MS = 80
+    CHAR_MS = 45
+    WORD_GAP_MS = 60
+    COMMA_PAUSE_MS = 150
+    SENTENCE_PAUSE_MS = 350
+    LEAD_IN_MS = 100
+
+    def select_voice(self) -> str:
+        # Edge backend'iyle aynı dönüşüm kuralı (iki ses arasında)
+        return "offline-low" if get_current_index() % 2 == 1 else "offline-high"
+
+    def cache_key(self, text: str, voice: str) -> Optional[str]:
+        return None  # Üretimi önbellek okumasından ucuz
+
+    def plan_words(self, text: str):
+        """Kelimeler ve (offset, süre) ms değerleri, toplam süre ms."""
+        words, offsets, durations = [], [], []
+        cursor = self.LEAD_IN_MS
+        for word in text.split():
+            spoken = re.sub(r"[^\w'-]", "", word)
+            if spoken:
+                duration = self.WORD_BASE_MS + self.CHAR_MS * len(spoken)
+                words.append(spoken)
+                offsets.append(cursor)
+                durations.append(duration)
+                cursor += duration + self.WORD_GAP_MS
+            if word[-1] in ".!?":
+                cursor += self.SENTENCE_PAUSE_MS
+            elif word[-1] in ",;:":
+                cursor += self.COMMA_PAUSE_MS
+        return words, offsets, durations, cursor
+
+    async def synthesize(self, text: str, voice: str) -> SynthesisResult:
+        words, offsets, durations, total_ms = self.plan_words(text)
+        pcm = np.zeros(total_ms * OUTPUT_SAMPLE_RATE // 1000, dtype=np.float32)
+        frequency = self.VOICES.get(voice, 180.0)
+        for offset, duration in zip(offsets, durations):
+            start = offset * OUTPUT_SAMPLE_RATE // 1000
+            t = np.arange(duration * OUTPUT_SAMPLE_RATE // 1000, dtype=np.float32) / OUTPUT_SAMPLE_RATE
+            envelope = np.sin(np.pi * t / t[-1]) if len(t) > 1 else 1.0  # Tıklamasız giriş/çıkış
+            pcm[start:start + len(t)] = 0.2 * envelope * np.sin(2 * np.pi * frequency * t)
+        # ffmpeg kodlaması event loop'u bloklamaz: parçalar TTS_CONCURRENCY kadar paralel işlenir
+        audio = await asyncio.to_thread(_encode_mp3, (pcm * 32767).astype(np.int16))
+        return audio, words, [offset + MP3_DELAY_MS for offset in offsets], durations
+
+
+def _encode_mp3(pcm: np.ndarray) -> bytes:
+    """Mono s16 PCM → 24 kHz CBR 48 kbps MP3 (Xing/ID3 etiketi yok: parçalar art arda eklenebilir)."""
+    result = subprocess.run(
+        [get_ffmpeg_exe(), "-v", "error", "-f", "s16le", "-ar", str(OUTPUT_SAMPLE_RATE), "-ac", "1", "-i", "-",
+         "-c:a", "libmp3lame", "-b:a", f"{OUTPUT_BITRATE // 1000}k",
+         "-write_xing", "0", "-id3v2_version", "0", "-f", "mp3", "-"],
+        input=pcm.tobytes(), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"❌ ffmpeg MP3 kodlama hatası: {result.stderr.decode(errors='ignore')}")
+    return result.stdout
+
+
+_BACKENDS = {"edge": EdgeTTSBackend, "offline": OfflineTTSBackend}
+_instances = {}
+
+
+def get_tts_backend(name: Optional[str] = None) -> TTSBackend:
+    """Adı verilen (varsayılan: Config.TTS_BACKEND) backend'in süreç düzeyindeki örneği."""
+    name = name or Config.TTS_BACKEND
+    if name not in _BACKENDS:
+        raise ValueError(f"Bilinmeyen TTS backend: {name} (seçenekler: {', '.join(_BACKENDS)})")
+    if name not in _instances:
+        _instances[name] = _BACKENDS[name]()
+    return _instances[name]
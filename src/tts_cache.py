@@ -0,0 +1,81 @@
+# src/tts_cache.py
+"""
+TTS Cache
+=========
+
+Seslendirilmiş metin parçalarını içerik özetine göre saklar. Anahtar:
+hash(temiz metin, ses, rate, volume, pitch). Her girdi tek bir .npz dosyasıdır
+(MP3 baytları + kelime zamanlamaları). Değişmeyen cümleler TTS servisine
+ikinci kez gönderilmez; disk bütçesi aşılınca en eski kullanılan girdiler silinir.
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.config import Config
+from src.disk_cache import atomic_path, mark_used, prune_lru
+
+logger = logging.getLogger("SynapseDaily")
+
+
+def chunk_key(text: str, voice: str, rate: str, volume: str, pitch: str) -> str:
+    return hashlib.sha1(repr((text, voice, rate, volume, pitch)).encode("utf-8")).hexdigest()
+
+
+class TTSCache:
+    def __init__(self, cache_dir: Path, max_disk_bytes: int = 0):
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[Tuple[bytes, List[str], List[int], List[int]]]:
+        """(mp3 baytları, kelimeler, offset'ler ms, süreler ms) veya None."""
+        path = self.path_for(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            with np.load(str(path), allow_pickle=False) as data:
+                result = (data["audio"].tobytes(), data["words"].tolist(),
+                          data["offsets"].tolist(), data["durations"].tolist())
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ TTS önbelleği okunamadı ({path.name}): {e}")
+            self.misses += 1
+            return None
+        mark_used(path)
+        self.hits += 1
+        return result
+
+    def put(self, key: str, audio: bytes, words: List[str], offsets: List[int], durations: List[int]):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_path(self.path_for(key)) as tmp_path, open(tmp_path, "wb") as f:
+                np.savez(f, audio=np.frombuffer(audio, dtype=np.uint8), words=np.array(words, dtype=str),
+                         offsets=np.array(offsets, dtype=np.int32), durations=np.array(durations, dtype=np.int32))
+        except OSError as e:
+            logger.warning(f"⚠️ TTS önbelleği yazılamadı: {e}")
+
+    def prune(self):
+        """Disk bütçesi aşılırsa en eski kullanılan girdileri siler."""
+        prune_lru(self.cache_dir, "*.npz", self.max_disk_bytes)
+
+
+_cache: Optional[TTSCache] = None
+
+
+def get_tts_cache() -> Optional[TTSCache]:
+    """Süreç düzeyindeki TTS önbelleğini döner (Config.TTS_CACHE kapalıysa None)."""
+    global _cache
+    if not Config.TTS_CACHE:
+        return None
+    if _cache is None:
+        _cache = TTSCache(Config.TTS_CACHE_DIR, max_disk_bytes=Config.TTS_CACHE_MB * 1024 * 1024)
+    return _cache
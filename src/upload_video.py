@@ -11,8 +11,16 @@ from src.utils import setup_logging, save_upload_log
 
 logger = setup_logging()
 
-def get_authenticated_service():
-    """Token'ı hem yerelde hem sunucuda yönetir."""
+# OAuth scope'ları: video/oynatma listesi için 'youtube', altyazı (captions.insert) için 'youtube.force-ssl'.
+# Altyazı yüklenecekse YOUTUBE_TOKEN_ENCODED token'ı iki scope ile birlikte üretilmelidir.
+YOUTUBE_SCOPE = "https://www.googleapis.com/auth/youtube"
+CAPTIONS_SCOPE = "https://www.googleapis.com/auth/youtube.force-ssl"
+
+def get_authenticated_service(required_scopes=()):
+    """
+    Token'ı hem yerelde hem sunucuda yönetir.
+    required_scopes: token'da bulunması gereken scope'lar; eksikse RuntimeError.
+    """
     creds = None
     token_base64 = os.environ.get("YOUTUBE_TOKEN_ENCODED")
 
@@ -35,11 +43,17 @@ def get_authenticated_service():
         logger.error("❌ Token geçersiz veya bulunamadı!")
         raise RuntimeError("❌ YouTube kimlik doğrulaması başarısız!")
 
+    missing = [scope for scope in required_scopes if scope not in (getattr(creds, "scopes", None) or [])]
+    if missing:
+        raise RuntimeError(f"❌ YouTube token'ında gerekli scope yok: {', '.join(missing)} "
+                           f"(token bu scope'larla yeniden üretilmeli)")
+
     # ⚠️ DİKKAT: Oynatma listesi için 'youtube' scope gerekli!
     return build("youtube", "v3", credentials=creds)
 
-def upload_to_youtube(video_path: str, title: str, description: str, privacy_status: str, mode: str):
-    """Videoyu YouTube'a yükle."""
+def upload_to_youtube(video_path: str, title: str, description: str, privacy_status: str, mode: str,
+                      caption_path: str = None):
+    """Videoyu YouTube'a yükle. caption_path verilirse altyazı dosyası da eklenir."""
     youtube = get_authenticated_service()
 
     safe_title = title[:95] + "..." if len(title) > 95 else title
@@ -81,8 +95,42 @@ def upload_to_youtube(video_path: str, title: str, description: str, privacy_sta
     video_id = response["id"]
     logger.info(f"✅ YouTube ID: {video_id}")
     save_upload_log(video_id, safe_title, mode)
+    
+    if caption_path and os.path.exists(caption_path):
+        upload_captions(video_id, caption_path)
     return video_id
 
+def upload_captions(video_id: str, caption_path: str, language: str = "en", name: str = "English"):
+    """Zamanlı altyazı dosyasını (.srt/.vtt) videoya ekler."""
+    # ⚠️ DİKKAT: captions.insert için 'youtube.force-ssl' scope gerekli!
+    try:
+        youtube = get_authenticated_service(required_scopes=(CAPTIONS_SCOPE,))
+    except RuntimeError as e:
+        # Video yüklendi; altyazı eksikliği pipeline'ı durdurmaz ama açıkça raporlanır
+        logger.error(f"❌ Altyazı yüklenemedi ({os.path.basename(caption_path)} → {video_id}): {e}")
+        return
+    
+    logger.info(f"💬 Altyazı yükleniyor: {os.path.basename(caption_path)} → {video_id}")
+    
+    request_body = {
+        "snippet": {
+            "videoId": video_id,
+            "language": language,
+            "name": name,
+            "isDraft": False
+        }
+    }
+    
+    try:
+        response = youtube.captions().insert(
+            part="snippet",
+            body=request_body,
+            media_body=MediaFileUpload(caption_path, mimetype="application/octet-stream", resumable=True)
+        ).execute()
+        logger.info(f"✅ Altyazı eklendi! Caption ID: {response['id']}")
+    except Exception as e:
+        logger.error(f"❌ Altyazı yükleme hatası: {str(e)}")
+
 def add_video_to_playlist(video_id: str, playlist_id: str):
     """Videoyu belirtilen oynatma listesine ekler."""
     youtube = get_authenticated_service()
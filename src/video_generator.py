@@ -2,21 +2,22 @@
 import os
 import tempfile
 import shutil
-import multiprocessing
 import asyncio
 from pathlib import Path
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-from moviepy.editor import (
-    ColorClip, CompositeVideoClip, AudioFileClip, ImageClip, concatenate_videoclips, CompositeAudioClip, concatenate_audioclips
-)
 from src.config import Config
 from src.utils import setup_logging
-from src.tts import generate_voice_with_edge_tts
+from src.tts import generate_voice_with_edge_tts, load_word_timings
+from src.audio_mix import AAC_BITRATE, mix_narration
+from src.audio_probe import audio_duration
+from src.encoder_profile import choose_encoder, size_targeted
+from src.image_manifest import scan_images
+from src.renderer import Timeline, render_timeline
+from src.caption_layout import get_layout, layout_podcast_block, layout_shorts_block
+from src.caption_timing import align_word_starts, caption_times
+from src.subtitles import write_srt, write_vtt
 
 logger = setup_logging()
-CORES = multiprocessing.cpu_count()
-FPS = 24  # Sabit FPS
 
 def clean_text(text: str) -> str:
     """Unicode karakterleri temizler."""
@@ -24,48 +25,22 @@ def clean_text(text: str) -> str:
     nfkd = unicodedata.normalize('NFKD', text)
     return nfkd.encode('ascii', 'ignore').decode('ascii')
 
-def _is_nvidia_gpu() -> bool:
-    """NVIDIA GPU var mı kontrol eder."""
-    try:
-        import subprocess
-        result = subprocess.run(["nvidia-smi"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return result.returncode == 0
-    except:
-        return False
-
 def get_all_images_from_folder(folder_path: Path) -> list:
     """
-    Klasördeki TÜM görselleri bulur (1.png, 2.png, 3.png... şeklinde).
+    Klasördeki TÜM görselleri bulur (her uzantı ve adlandırma, doğal sırada).
+    Klasör tek geçişte taranır; boyut/özet bilgisi görsel index'inde tutulur.
     Args:
         folder_path: Klasör yolu
     Returns:
-        list: Görsel yolları listesi (sıralı)
+        list: Görsel manifest girdileri (sıralı): {"path", "width", "height", ...}
     """
-    image_paths = []
-    index = 1
-    
-    # 1.png'den başla, dosya bulunana kadar devam et
-    while True:
-        img_path = folder_path / f"{index}.png"
-        if img_path.exists():
-            image_paths.append(str(img_path))
-            logger.debug(f"🖼️ Görsel bulundu: {img_path}")
-            index += 1
-        else:
-            # Dosya yoksa döngüyü bitir
-            logger.info(f"✅ Toplam {len(image_paths)} görsel bulundu ({folder_path.name}/)")
-            break
-        
-        # Güvenlik: Maksimum 100 görsel
-        if index > 100:
-            logger.warning(f"⚠️ Maksimum görsel sayısına ulaşıldı (100)")
-            break
-    
-    return image_paths
+    images = scan_images(folder_path)
+    logger.info(f"✅ Toplam {len(images)} görsel bulundu ({Path(folder_path).name}/)")
+    return images
 
 # ====================== PODCAST İÇİN ÖZEL KEN BURNS SİSTEMİ ======================
 
-def create_podcast_bg_with_timed_effects(image_paths, total_duration, width, height):
+def create_podcast_bg_with_timed_effects(timeline, image_paths, image_sizes=None):
     """
     Podcast için zamanlamalı Ken Burns efekti:
     - 0-5 dk: Sürekli Ken Burns
@@ -73,15 +48,18 @@ def create_podcast_bg_with_timed_effects(image_paths, total_duration, width, hei
     - 9+ dk: Efektsiz (statik)
     - Her görsel 25 sn ekranda kalır
     - Görseller başa döner (loop)
+    Arka plan katmanlarını timeline'a ekler (image_sizes: yol → manifest'teki boyut).
     """
-    clips = []
+    image_sizes = image_sizes or {}
+    total_duration = timeline.duration
     elapsed = 0.0
     image_index = 0
     
     # Görsel yoksa siyah ekran
     if not image_paths:
         logger.warning("⚠️ Podcast görseli bulunamadı → Siyah arka plan")
-        return ColorClip((width, height), (0, 0, 0)).set_duration(total_duration)
+        timeline.add_background(None, 0.0, total_duration)
+        return
     
     while elapsed < total_duration:
         # Görsel index'i loop yap (başa dön)
@@ -98,64 +76,44 @@ def create_podcast_bg_with_timed_effects(image_paths, total_duration, width, hei
         if Path(img_path).exists():
             logger.info(f"🖼️ Podcast görseli #{image_index + 1}: {Path(img_path).name} ({elapsed:.1f}s - {elapsed + clip_duration:.1f}s)")
             
-            # Görseli yükle ve boyutlandır
-            clip = ImageClip(str(img_path))
-            clip_ratio = clip.w / clip.h
-            target_ratio = width / height
-            
-            if clip_ratio > target_ratio:
-                clip = clip.resize(height=height)
-            else:
-                clip = clip.resize(width=width)
-            
             # Ken Burns efekti zamanlaması
             if elapsed < 300:  # 0-5 dk: Sürekli Ken Burns
-                clip = clip.set_duration(clip_duration).resize(
-                    lambda t: 1 + 0.02 * (t / clip_duration)
-                ).set_position('center')
-                
+                zoom = 0.02
             elif elapsed < 540:  # 5-9 dk: 30sn efekt VAR, 30sn efekt YOK
                 cycle_position = (elapsed - 300) % 60  # 0-60 sn arası döngü
-                
-                if cycle_position < 30:  # İlk 30sn: Ken Burns VAR
-                    clip = clip.set_duration(clip_duration).resize(
-                        lambda t: 1 + 0.02 * (t / clip_duration)
-                    ).set_position('center')
-                else:  # Son 30sn: Ken Burns YOK (statik)
-                    clip = clip.set_duration(clip_duration).set_position('center')
-                    
+                zoom = 0.02 if cycle_position < 30 else 0.0
             else:  # 9+ dk: Efektsiz (statik)
-                clip = clip.set_duration(clip_duration).set_position('center')
+                zoom = 0.0
             
-            clips.append(clip)
-            elapsed += clip_duration
-            image_index += 1
+            timeline.add_background(img_path, elapsed, clip_duration, zoom=zoom, size=image_sizes.get(img_path))
         else:
             logger.warning(f"⚠️ Görsel bulunamadı: {img_path}")
-            clips.append(ColorClip((width, height), (0, 0, 0)).set_duration(clip_duration))
-            elapsed += clip_duration
-            image_index += 1
-    
-    return concatenate_videoclips(clips).set_duration(total_duration)
+            timeline.add_background(None, elapsed, clip_duration)
+        
+        elapsed += clip_duration
+        image_index += 1
 
 # ====================== SHORTS İÇİN ÖZEL CANLI EFEKT SİSTEMİ ======================
 
-def create_shorts_bg_with_live_effect(image_paths, total_duration, width, height):
+def create_shorts_bg_with_live_effect(timeline, image_paths, image_sizes=None):
     """
     Shorts için canlı efekt sistemi:
     - Her görsel 5.5 sn ekranda kalır
     - 1. görsel: Ken Burns YOK (statik)
     - 2.+ görseller: Ken Burns VAR
     - Görseller başa DÖNMEZ (son görsel video sonuna kadar kalır)
+    Arka plan katmanlarını timeline'a ekler (image_sizes: yol → manifest'teki boyut).
     """
-    clips = []
+    image_sizes = image_sizes or {}
+    total_duration = timeline.duration
     elapsed = 0.0
     image_index = 0
     
     # Görsel yoksa siyah ekran
     if not image_paths:
         logger.warning("⚠️ Shorts görseli bulunamadı → Siyah arka plan")
-        return ColorClip((width, height), (0, 0, 0)).set_duration(total_duration)
+        timeline.add_background(None, 0.0, total_duration)
+        return
     
     while elapsed < total_duration:
         # Son görseldeyiz ve video bitmek üzere → başa DÖNME (son görseli uzat)
@@ -166,24 +124,10 @@ def create_shorts_bg_with_live_effect(image_paths, total_duration, width, height
                 last_img_path = image_paths[-1]
                 logger.info(f"🖼️ Shorts son görsel uzatılıyor: {Path(last_img_path).name} ({remaining_time:.1f}s)")
                 
-                clip = ImageClip(str(last_img_path))
-                clip_ratio = clip.w / clip.h
-                target_ratio = width / height
-                
-                if clip_ratio > target_ratio:
-                    clip = clip.resize(height=height)
-                else:
-                    clip = clip.resize(width=width)
-                
                 # Son görsel de Ken Burns ile (çünkü 1. değil)
-                if len(image_paths) > 1:
-                    clip = clip.set_duration(remaining_time).resize(
-                        lambda t: 1 + 0.03 * (t / remaining_time)
-                    ).set_position('center')
-                else:
-                    clip = clip.set_duration(remaining_time).set_position('center')
-                
-                clips.append(clip)
+                zoom = 0.03 if len(image_paths) > 1 else 0.0
+                timeline.add_background(last_img_path, elapsed, remaining_time, zoom=zoom,
+                                        size=image_sizes.get(last_img_path))
                 elapsed += remaining_time
             break
         
@@ -196,229 +140,189 @@ def create_shorts_bg_with_live_effect(image_paths, total_duration, width, height
         if Path(img_path).exists():
             logger.info(f"🖼️ Shorts görseli #{image_index + 1}: {Path(img_path).name} ({elapsed:.1f}s - {elapsed + clip_duration:.1f}s)")
             
-            # Görseli yükle ve boyutlandır
-            clip = ImageClip(str(img_path))
-            clip_ratio = clip.w / clip.h
-            target_ratio = width / height
-            
-            if clip_ratio > target_ratio:
-                clip = clip.resize(height=height)
-            else:
-                clip = clip.resize(width=width)
-            
             # 1. görsel: Ken Burns YOK, diğerleri: Ken Burns VAR
             if image_index == 0:
-                # İlk görsel statik
-                clip = clip.set_duration(clip_duration).set_position('center')
+                timeline.add_background(img_path, elapsed, clip_duration, size=image_sizes.get(img_path))
                 logger.debug(f"  → İlk görsel: Statik (Ken Burns YOK)")
             else:
-                # Diğer görseller: Ken Burns efekti
-                clip = clip.set_duration(clip_duration).resize(
-                    lambda t: 1 + 0.03 * (t / clip_duration)
-                ).set_position('center')
+                timeline.add_background(img_path, elapsed, clip_duration, zoom=0.03,
+                                        size=image_sizes.get(img_path))
                 logger.debug(f"  → Görsel #{image_index + 1}: Ken Burns VAR")
-            
-            clips.append(clip)
-            elapsed += clip_duration
-            image_index += 1
         else:
             logger.warning(f"⚠️ Görsel bulunamadı: {img_path}")
-            clips.append(ColorClip((width, height), (0, 0, 0)).set_duration(clip_duration))
-            elapsed += clip_duration
-            image_index += 1
-    
-    return concatenate_videoclips(clips).set_duration(total_duration)
+            timeline.add_background(None, elapsed, clip_duration)
+        
+        elapsed += clip_duration
+        image_index += 1
 
 # ====================== METİN GÖRSEL OLUŞTURUCU ======================
 
-def create_text_image(text, width, height, is_shorts):
-    """Metni şeffaf arka planlı görsel olarak oluşturur."""
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Font boyutları
-    fontsize = 72 if is_shorts else 60
-    try:
-        font = ImageFont.truetype("DejaVuSans-Bold.ttf", fontsize)
-    except OSError:
-        try:
-            font = ImageFont.truetype("Arial-Bold.ttf", fontsize)
-        except OSError:
-            font = ImageFont.load_default()
+def caption_style(is_shorts):
+    """Altyazı font boyutu ve kontur kalınlığı."""
+    return (72, 3) if is_shorts else (60, 2)
 
-    text = clean_text(text)
+def layout_captions(script, width, height, is_shorts):
+    """
+    Tüm script'i render başlamadan önce tek seferde altyazı bloklarına yerleştirir.
+    Returns:
+        list: {"text", "word_index", "word_count", "placed"} — placed: [(satır, (x, y)), ...]
+    """
+    fontsize, stroke_width = caption_style(is_shorts)
+    layout = get_layout(fontsize, stroke_width)
+    words_per_line = 4 if is_shorts else 8
     
-    if is_shorts:
-        # Shorts için ortalanmış metin (tek satır)
-        words = text.split()
-        lines = []
-        current_line = ""
-        for word in words:
-            test = current_line + " " + word if current_line else word
-            bbox = draw.textbbox((0, 0), test, font=font)
-            if bbox[2] < width * 0.85:
-                current_line = test
-            else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-
-        # Tüm metni ortala
-        full_text = "\n".join(lines)
-        bbox = draw.multiline_textbbox((0, 0), full_text, font=font, align="center")
-        x = (width - (bbox[2] - bbox[0])) // 2
-        y = (height - (bbox[3] - bbox[1])) // 2 - 50
-        
-        draw.multiline_text(
-            (x, y), 
-            full_text, 
-            font=font, 
-            fill="white", 
-            stroke_width=3, 
-            stroke_fill="black",
-            align="center"
-        )
-    else:
-        # Podcast için alt metin (maks 3 satır)
-        max_width = width - 200
-        lines = []
-        words = text.split()
-        current_line = ""
-        for word in words:
-            test_line = current_line + (" " + word if current_line else word)
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            if bbox[2] <= max_width:
-                current_line = test_line
-            else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-        
-        # En fazla 3 satır göster
-        lines = lines[:3]
-        y_offset = height - 350
+    words = script.split()
+    captions = []
+    for i in range(0, len(words), words_per_line):
+        line_words = words[i:i + words_per_line]
+        line_text = " ".join(line_words)
+        if not line_text.strip():
+            continue
         
-        for line in lines:
-            draw.text(
-                (150, y_offset), 
-                line, 
-                font=font, 
-                fill="white", 
-                stroke_width=2, 
-                stroke_fill="black"
-            )
-            y_offset += fontsize + 10
-
-    return img
+        clean_words = clean_text(line_text).split()
+        if is_shorts:
+            placed = layout_shorts_block(layout, clean_words, width, height)
+        else:
+            placed = layout_podcast_block(layout, clean_words, width, height, fontsize)
+        captions.append({"text": line_text, "word_index": i, "word_count": len(line_words), "placed": placed})
+    
+    logger.info(f"📝 {len(captions)} altyazı bloğu yerleştirildi")
+    return captions
 
 # ====================== ANA VİDEO ÜRETİM FONKSİYONU ======================
 
-def create_video_with_chunks(script, output_path, is_shorts=True):
+def scale_caption(placed, style, scale):
+    """Tam çözünürlükte yapılan altyazı yerleşimini render çözünürlüğüne ölçekler."""
+    if scale == 1.0:
+        return placed, style
+    lines = [(text, (x * scale, y * scale)) for text, (x, y) in placed]
+    fontsize, stroke_width = style
+    return lines, (max(1, round(fontsize * scale)), max(1, round(stroke_width * scale)))
+
+def create_video_with_chunks(script, output_path, is_shorts=True, burn_captions=True, quality="final",
+                             audio_path=None, word_timings=None):
     """
     Video üretim fonksiyonu - özel Ken Burns zamanlaması ile.
+    Altyazılar her zaman çıktının yanına .srt / .vtt olarak da yazılır.
     
     Args:
         script (str): Üretilecek metin
         output_path (str): Çıktı video yolu
         is_shorts (bool): Shorts mı podcast mi?
+        burn_captions (bool): False → altyazı videoya gömülmez (sadece arka plan + ses)
+        quality (str): Config.QUALITY_PROFILES anahtarı ("final" veya "draft")
+        audio_path (str): Hazır anlatım sesi; None → script burada seslendirilir
+        word_timings (dict): Anlatımın kelime zamanlamaları; None → ses dosyasının
+            yanındaki .words.npz okunur (yoksa ortalama kelime süresiyle tahmin)
     """
-    logger.info(f"🎥 {'Shorts' if is_shorts else 'Podcast'} videosu üretiliyor (Dinamik görsel tarama)...")
+    profile = Config.QUALITY_PROFILES[quality]
+    logger.info(f"🎥 {'Shorts' if is_shorts else 'Podcast'} videosu üretiliyor (Dinamik görsel tarama, kalite: {quality})...")
     
     # Geçici dizin oluştur
     with tempfile.TemporaryDirectory(dir=str(Config.TEMP_DIR)) as temp_dir:
         temp_path = Path(temp_dir)
-        audio_path = temp_path / "audio.mp3"
         
-        # SESLİNDİRME
-        asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
-        audio = AudioFileClip(str(audio_path))
-        total_duration = min(audio.duration, Config.MAX_SHORTS_DURATION if is_shorts else Config.MAX_PODCAST_DURATION)
+        # SESLİNDİRME (pipeline hazır anlatım verdiyse tekrar yapılmaz)
+        if audio_path is None:
+            audio_path = temp_path / "audio.mp3"
+            word_timings = asyncio.run(generate_voice_with_edge_tts(script, str(audio_path)))
+        elif word_timings is None:
+            word_timings = load_word_timings(str(audio_path))
         
-        # Arka plan sesi ekle
-        bg_audio_path = Config.DATA_DIR / "1.mp3"
-        if bg_audio_path.exists():
-            bg_audio = AudioFileClip(str(bg_audio_path))
-            if bg_audio.duration < total_duration:
-                loops_needed = int(total_duration // bg_audio.duration) + 1
-                bg_audio = concatenate_audioclips([bg_audio] * loops_needed)
-            bg_audio = bg_audio.subclip(0, total_duration)
-            bg_audio = bg_audio.volumex(0.1)
-            combined_audio = CompositeAudioClip([audio, bg_audio])
-        else:
-            combined_audio = audio
+        # Arka plan sesiyle tek seferde miks (render sonunda stream copy ile mux edilir)
+        mix_path = temp_path / "mix.m4a"
+        max_duration = Config.MAX_SHORTS_DURATION if is_shorts else Config.MAX_PODCAST_DURATION
+        
+        def mix():
+            return mix_narration(str(audio_path), str(mix_path), max_duration,
+                                 bed_path=str(Config.DATA_DIR / "1.mp3"), bed_gain=0.1)
         
-        # Video boyutları
-        width, height = (1080, 1920) if is_shorts else (1920, 1080)
+        # Süre başlıktan okunur: planlama anlatım decode/miks edilmeden yapılır
+        try:
+            total_duration = min(audio_duration(str(audio_path)), max_duration)
+        except ValueError as e:
+            logger.warning(f"⚠️ Ses başlığı okunamadı ({e}), süre miksten alınacak")
+            total_duration = mix()
+        
+        # Video boyutları (yerleşim tam çözünürlükte, render profil çözünürlüğünde)
+        layout_width, layout_height = (1080, 1920) if is_shorts else (1920, 1080)
+        scale = profile["scale"]
+        width = int(round(layout_width * scale / 2)) * 2  # yuv420p için çift boyut
+        height = int(round(layout_height * scale / 2)) * 2
+        timeline = Timeline(width, height, total_duration, fps=profile["fps"])
         
         # 👇 DİNAMİK GÖRSEL TARAMA
         if is_shorts:
             # Shorts görselleri: sor klasörü
             sor_folder = Config.DATA_DIR / "images" / "sor"
-            image_paths = get_all_images_from_folder(sor_folder)
+            images = get_all_images_from_folder(sor_folder)
         else:
             # Podcast görselleri: pod klasörü
             pod_folder = Config.DATA_DIR / "images" / "pod"
-            image_paths = get_all_images_from_folder(pod_folder)
+            images = get_all_images_from_folder(pod_folder)
+        image_paths = [image["path"] for image in images]
+        # Boyutlar index'ten: render sırasında görseller boyut için yeniden açılmaz
+        image_sizes = {image["path"]: (image["width"], image["height"]) for image in images}
 
         # 👇 ÖZEL KEN BURNS ZAMANLAMASI
         if is_shorts:
-            background = create_shorts_bg_with_live_effect(image_paths, total_duration, width, height)
+            create_shorts_bg_with_live_effect(timeline, image_paths, image_sizes)
         else:
-            background = create_podcast_bg_with_timed_effects(image_paths, total_duration, width, height)
+            create_podcast_bg_with_timed_effects(timeline, image_paths, image_sizes)
         
         # Yarı şeffaf overlay
-        overlay = ColorClip((width, height), (0, 0, 0)).set_duration(total_duration).set_opacity(0.3)
+        timeline.overlay_opacity = 0.3
         
-        # Metni parçalara böl (ses-yazı uyumu)
-        words = script.split()
-        text_clips = []
-        start_time = 0.0
+        # Metni parçalara böl (ses-yazı uyumu) — yerleşim tüm script için önceden
+        captions = layout_captions(script, layout_width, layout_height, is_shorts)
         
-        avg_word_duration = total_duration / len(words) if words else 0.3
-        words_per_line = 4 if is_shorts else 8
+        words = script.split()
+        if word_timings and word_timings["words"]:
+            # TTS kelime sınırlarından: zamanlama bir tablo okuması
+            word_starts = align_word_starts(words, word_timings)
+            times = caption_times(captions, word_starts, total_duration, word_timings)
+        else:
+            # Zamanlama yoksa ortalama kelime süresiyle tahmin
+            avg_word_duration = total_duration / len(words) if words else 0.3
+            times = [(c["word_index"] * avg_word_duration, (c["word_index"] + c["word_count"]) * avg_word_duration)
+                     for c in captions]
         
-        for i in range(0, len(words), words_per_line):
+        subtitle_entries = []
+        for caption, (start_time, end_time) in zip(captions, times):
             if start_time >= total_duration:
                 break
             
-            line_words = words[i:i + words_per_line]
-            line_text = " ".join(line_words)
-            
-            if not line_text.strip():
+            line_text = caption["text"]
+            line_duration = min(end_time, total_duration) - start_time
+            if line_duration <= 0:
                 continue
             
-            line_duration = len(line_words) * avg_word_duration
-            line_duration = max(1.0, min(line_duration, total_duration - start_time))
-            
-            text_img = create_text_image(line_text, width, height, is_shorts)
-            img_path = temp_path / f"text_{start_time:.1f}.png"
-            text_img.save(str(img_path))
-            
-            txt_clip = (ImageClip(str(img_path), duration=line_duration, transparent=True)
-                        .set_start(start_time)
-                        .set_position('center' if is_shorts else ('center', 'bottom')))
+            subtitle_entries.append((start_time, start_time + line_duration, line_text))
+            if not burn_captions:
+                continue
             
-            text_clips.append(txt_clip)
-            start_time += line_duration
+            # Sprite render sırasında, altyazı ekrandayken üretilir
+            lines, style = scale_caption(caption["placed"], caption_style(is_shorts), scale)
+            timeline.add_caption(lines, style, start_time, line_duration)
         
-        # Final videoyu birleştir
-        final_video = CompositeVideoClip([background, overlay] + text_clips).set_audio(combined_audio).set_duration(total_duration)
+        # Sidecar altyazılar (YouTube captions için)
+        write_srt(subtitle_entries, str(Path(output_path).with_suffix(".srt")))
+        write_vtt(subtitle_entries, str(Path(output_path).with_suffix(".vtt")))
+        if not burn_captions:
+            logger.info(f"💬 Altyazılar videoya gömülmedi, {len(subtitle_entries)} blok .srt/.vtt olarak yazıldı")
         
-        # Videoyu yaz
-        codec = "h264_nvenc" if _is_nvidia_gpu() else "libx264"
-        preset = "fast" if _is_nvidia_gpu() else "ultrafast"
+        # Videoyu yaz (kareler doğrudan ffmpeg'e pipe edilir)
+        # Encoder: kalite profilinde sabit değilse makine profilinden (donanım süreç başına bir kez yoklanır)
+        encoder = profile["encoder"] or choose_encoder()
+        if profile["size_target"]:
+            # Capped CRF: yükleme boyutu mod hedefiyle sınırlı (ses, miks bitrate'inden tahminle bütçeden düşülür)
+            encoder = size_targeted(encoder, "shorts" if is_shorts else "podcast", total_duration,
+                                    audio_bytes=int(total_duration * AAC_BITRATE / 8))
         
-        final_video.write_videofile(
-            str(output_path),
-            fps=FPS,
-            codec=codec,
-            audio_codec="aac",
-            threads=CORES,
-            preset=preset,
-            logger=None
-        )
+        if not mix_path.exists():
+            mix()
+        render_timeline(timeline, str(output_path), audio_path=str(mix_path), encoder=encoder,
+                        workers=Config.RENDER_WORKERS, producers=Config.RENDER_PRODUCERS)
         
         logger.info(f"✅ Video hazır: {output_path}")
         
@@ -426,12 +330,16 @@ def create_video_with_chunks(script, output_path, is_shorts=True):
         logger.info(f"📊 Video boyutu: {output_file_path.stat().st_size / (1024*1024):.2f} MB")
 
 
-def create_shorts_video(audio_path: str, script: str, output_path: str):
-    """Geriye uyumluluk için - yeni fonksiyona yönlendirir."""
+def create_shorts_video(audio_path: str, script: str, output_path: str, quality: str = "final",
+                        word_timings: dict = None):
+    """Hazır anlatımla (audio_path + kelime zamanlamaları) shorts videosu üretir."""
     logger.info(f"🎥 Shorts videosu üretiliyor (Canlı efekt sistemi)...")
-    create_video_with_chunks(script, output_path, is_shorts=True)
+    create_video_with_chunks(script, output_path, is_shorts=True, quality=quality,
+                             audio_path=audio_path, word_timings=word_timings)
 
-def create_podcast_video(audio_path: str, script: str, output_path: str):
-    """Geriye uyumluluk için - yeni fonksiyona yönlendirir."""
+def create_podcast_video(audio_path: str, script: str, output_path: str, quality: str = "final",
+                         word_timings: dict = None):
+    """Hazır anlatımla (audio_path + kelime zamanlamaları) podcast videosu üretir."""
     logger.info(f"🎥 Podcast videosu üretiliyor (Zamanlamalı Ken Burns)...")
-    create_video_with_chunks(script, output_path, is_shorts=False)
+    create_video_with_chunks(script, output_path, is_shorts=False, burn_captions=Config.PODCAST_BURN_CAPTIONS,
+                             quality=quality, audio_path=audio_path, word_timings=word_timings)